@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
+SETUP_PY = Path(__file__).parent.parent / "tools" / "setup.py"
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add --run-eval option for API-based evaluation tests."""
@@ -26,3 +30,11 @@ def pytest_collection_modifyitems(
     for item in items:
         if "eval" in item.keywords:
             item.add_marker(skip_eval)
+
+
+@pytest.fixture(scope="session")
+def setup_source() -> str:
+    """Contents of tools/setup.py, read once per session."""
+    if not SETUP_PY.exists():
+        pytest.skip("setup.py not found")
+    return SETUP_PY.read_text(encoding="utf-8")
@@ -16,6 +16,7 @@ from eval_rubric import (
     Rubric,
     load_challenge,
     load_challenges,
+    load_challenges_from_texts,
     score_response,
 )
 
@@ -75,6 +76,23 @@ class TestLoadChallenge:
         with pytest.raises(ValueError, match="Missing required rubric field"):
             load_challenge(bad)
 
+    def test_reload_picks_up_edits(self, tmp_path):
+        path = tmp_path / "edit.yaml"
+        body = (
+            "id: {id}\nname: test\ncategory: test\nprompt: test\n"
+            "rubric:\n  required_elements: {{a: A}}\n  passing_score: 1\n"
+        )
+        path.write_text(body.format(id="first"))
+        assert load_challenge(path).id == "first"
+
+        path.write_text(body.format(id="second-edit"))
+        assert load_challenge(path).id == "second-edit"
+
+    def test_load_from_prefetched_texts(self):
+        paths = sorted(CHALLENGES_DIR.glob("*.yaml"))
+        texts = {p: p.read_text(encoding="utf-8") for p in reversed(paths)}
+        assert load_challenges_from_texts(texts) == load_challenges(CHALLENGES_DIR)
+
     def test_nonexistent_directory(self, tmp_path):
         challenges = load_challenges(tmp_path / "nope")
         assert challenges == []
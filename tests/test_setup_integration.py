@@ -16,12 +16,15 @@ from setup import (
     CLAUDE_FOUNDRY_MARKER_END,
     GoBack,
     QuitSetup,
+    _link_or_copy,
+    _version_key,
     cmd_init,
     detect_templates,
     has_claude_foundry_header,
     load_manifest,
     migrate_manifest,
     save_manifest,
+    scan_extensions,
     toggle_menu,
 )
 
@@ -221,6 +224,25 @@ class TestManifestTracking:
         # Should still succeed
         assert (temp_project / "CLAUDE.md").exists()
 
+    def test_unchanged_project_reuses_cached_detection(self, temp_project, monkeypatch):
+        """Non-interactive re-init should skip the scan when inputs are unchanged."""
+        import setup as setup_py
+
+        (temp_project / "pyproject.toml").write_text("[project]\n")
+        cmd_init(temp_project, interactive=False)
+        cmd_init(temp_project, interactive=False)  # settles the top-level dir mtime
+        assert load_manifest(temp_project)["detection_cache"]["langs"] == ["python.md"]
+
+        def _no_scan(project):
+            raise AssertionError("scan_extensions should not run")
+
+        monkeypatch.setattr(setup_py, "scan_extensions", _no_scan)
+        assert cmd_init(temp_project, interactive=False) is True
+
+        (temp_project / "go.mod").write_text("module x\n")
+        with pytest.raises(AssertionError, match="should not run"):
+            cmd_init(temp_project, interactive=False)
+
 
 class TestContextLoadConfigurations:
     """Tests for context load of different project configurations."""
@@ -340,6 +362,90 @@ class TestVersionFile:
         assert len(rules) > 0
 
 
+class TestVersionKey:
+    """Tests for the tag ordering used by cmd_check."""
+
+    def test_numeric_not_lexicographic(self):
+        assert _version_key("v10.0.0") > _version_key("v9.0.0")
+
+    def test_max_picks_latest(self):
+        tags = ["v2026.2.9", "v2026.2.10", "v2025.12.1"]
+        assert max(tags, key=_version_key) == "v2026.2.10"
+
+
+class TestLinkOrCopy:
+    """Tests for the file deployment helper used by the copy_* functions."""
+
+    def test_copies_by_default(self, tmp_path, monkeypatch):
+        """Without the opt-in, deployed files must not share the source inode."""
+        monkeypatch.delenv("CLAUDE_FOUNDRY_HARDLINK", raising=False)
+        src = tmp_path / "src.md"
+        src.write_text("rule")
+        dst = tmp_path / "dst.md"
+
+        _link_or_copy(src, dst)
+        assert dst.read_text() == "rule"
+        assert not dst.samefile(src)
+
+    def test_hardlinks_when_enabled_and_detaches_later(self, tmp_path, monkeypatch):
+        """Opt-in deploys link the file; a later copy deploy replaces the link."""
+        src = tmp_path / "src.md"
+        src.write_text("rule")
+        dst = tmp_path / "dst.md"
+        dst.write_text("stale")
+
+        monkeypatch.setenv("CLAUDE_FOUNDRY_HARDLINK", "1")
+        _link_or_copy(src, dst)
+        assert dst.samefile(src)
+
+        monkeypatch.delenv("CLAUDE_FOUNDRY_HARDLINK")
+        _link_or_copy(src, dst)
+        assert dst.read_text() == "rule"
+        assert not dst.samefile(src)
+
+    def test_skips_unchanged_and_restores_edited(self, temp_project, monkeypatch):
+        """Re-deploys leave up-to-date files alone but replace local edits."""
+        monkeypatch.delenv("CLAUDE_FOUNDRY_HARDLINK", raising=False)
+        cmd_init(temp_project, interactive=False)
+        rule = next((temp_project / ".claude" / "rules").glob("*.md"))
+        original = rule.read_text()
+        rule.write_text("edited")
+        stale = temp_project / ".claude" / "skills" / "_lib" / "stale.sh"
+        stale.write_text("")
+
+        output = StringIO()
+        monkeypatch.setattr("sys.stdout", output)
+        cmd_init(temp_project, interactive=False)
+
+        assert "Files: 1 copied," in output.getvalue()
+        assert rule.read_text() == original
+        assert not stale.exists()
+
+
+class TestScanExtensions:
+    """Tests for the extension scan behind language/template detection."""
+
+    def test_stops_below_three_levels(self, tmp_path):
+        """Files deeper than three directory levels should not be scanned."""
+        (tmp_path / "a" / "b" / "c").mkdir(parents=True)
+        (tmp_path / "top.py").write_text("")
+        (tmp_path / "a" / "b" / "mid.go").write_text("")
+        (tmp_path / "a" / "b" / "c" / "deep.rs").write_text("")
+
+        assert scan_extensions(tmp_path) == {".py", ".go"}
+
+    def test_skips_hidden_and_node_modules(self, tmp_path):
+        """Dot-directories and node_modules should be pruned; dotfiles have no suffix."""
+        (tmp_path / ".venv").mkdir()
+        (tmp_path / ".venv" / "lib.py").write_text("")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "index.js").write_text("")
+        (tmp_path / ".bashrc").write_text("")
+        (tmp_path / "archive.tar.gz").write_text("")
+
+        assert scan_extensions(tmp_path) == {".gz"}
+
+
 class TestDetectTemplates:
     """Tests for template auto-detection."""
 
@@ -26,7 +26,10 @@ from eval_runner import (
     RunConfig,
     _build_judge_prompt,
     _build_subject_prompt,
+    _judge_batches,
+    _parse_batch_judge_response,
     _parse_judge_response,
+    run_challenge,
 )
 
 REPO_ROOT = Path(__file__).parent.parent
@@ -175,6 +178,124 @@ class TestJudgeParsing:
         assert elements[1].present is False  # elem_b missing → defaults False
 
 
+# ── Run orchestration ──
+
+
+class TestRunChallenge:
+    """Tests for run_challenge with the claude CLI stubbed out."""
+
+    @pytest.fixture
+    def stub_cli(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import eval_runner
+
+        verdict = {
+            "elements": {"elem_a": {"present": True, "evidence": "ok"}},
+            "anti_patterns": {},
+        }
+
+        def fake_cli(prompt: str, model: str = "opus") -> str:
+            if "evaluating an AI response" in prompt:
+                return json.dumps(verdict)
+            if '"runs"' in prompt:
+                return json.dumps({"runs": [verdict] * prompt.count("## Response ")})
+            return "subject response"
+
+        monkeypatch.setattr(eval_runner, "_claude_cli", fake_cli)
+
+    def test_baseline_attributed_to_no_skill(self, stub_cli: None, tmp_path: Path):
+        challenge = Challenge(
+            id="test-001",
+            name="Test",
+            category="test",
+            prompt="Do something.",
+            rubric=Rubric(required_elements={"elem_a": "Does A"}, anti_patterns={}, passing_score=1),
+            skill="megamind-deep",
+        )
+        config = RunConfig(challenges=[challenge], skills_dir=tmp_path, runs_per_challenge=1)
+
+        with_skill, baseline = run_challenge(challenge, config)
+
+        assert with_skill.skill_used == "megamind-deep"
+        assert baseline.skill_used is None
+        assert baseline.total_score == 1
+        assert baseline.raw_response == "subject response"
+
+    def test_one_judge_call_per_batch(self, monkeypatch: pytest.MonkeyPatch, stub_cli: None):
+        import eval_runner
+
+        calls: list[str] = []
+        fake_cli = eval_runner._claude_cli
+
+        def counting_cli(prompt: str, model: str = "opus") -> str:
+            calls.append(prompt)
+            return fake_cli(prompt, model)
+
+        monkeypatch.setattr(eval_runner, "_claude_cli", counting_cli)
+        challenge = Challenge(
+            id="test-001",
+            name="Test",
+            category="test",
+            prompt="Do something.",
+            rubric=Rubric(required_elements={"elem_a": "Does A"}, anti_patterns={}, passing_score=1),
+        )
+        config = RunConfig(challenges=[challenge], skills_dir=Path(), runs_per_challenge=3)
+
+        results = run_challenge(challenge, config)
+
+        assert len(results) == 6
+        assert all(r.passed for r in results)
+        assert len(calls) == 6 + 2  # six subject calls, one batched judge call per mode
+        batch_prompts = [c for c in calls if '"runs"' in c]
+        assert [c.count("## Response ") for c in batch_prompts] == [3, 3]
+
+    def test_malformed_batch_rejudged_per_response(self, monkeypatch: pytest.MonkeyPatch):
+        import eval_runner
+
+        calls: list[str] = []
+        verdict = {"elements": {"elem_a": {"present": True, "evidence": "ok"}}, "anti_patterns": {}}
+
+        def fake_cli(prompt: str, model: str = "opus") -> str:
+            calls.append(prompt)
+            if '"runs"' in prompt:
+                return "{truncated"
+            if "evaluating an AI response" in prompt:
+                return json.dumps(verdict)
+            return "subject response"
+
+        monkeypatch.setattr(eval_runner, "_claude_cli", fake_cli)
+        challenge = Challenge(
+            id="test-001",
+            name="Test",
+            category="test",
+            prompt="Do something.",
+            rubric=Rubric(required_elements={"elem_a": "Does A"}, anti_patterns={}, passing_score=1),
+        )
+        config = RunConfig(challenges=[challenge], skills_dir=Path(), runs_per_challenge=2)
+
+        results = run_challenge(challenge, config)
+
+        assert all(r.passed for r in results)
+        assert len(calls) == 4 + 2 + 4  # subjects, failed batches, single re-judges
+
+    def test_batches_respect_char_budget(self):
+        assert _judge_batches(["aaaa", "bbbb", "cc"], max_chars=6) == [["aaaa"], ["bbbb", "cc"]]
+        assert _judge_batches(["a" * 10], max_chars=6) == [["a" * 10]]
+        assert _judge_batches([], max_chars=6) == []
+
+    def test_batch_parse_rejects_wrong_run_count(self):
+        challenge = Challenge(
+            id="test-001",
+            name="Test",
+            category="test",
+            prompt="Do something.",
+            rubric=Rubric(required_elements={"elem_a": "Does A"}, anti_patterns={}, passing_score=1),
+        )
+        with pytest.raises(ValueError, match="expected 2"):
+            _parse_batch_judge_response(challenge, json.dumps({"runs": [{}]}), 2)
+        with pytest.raises(ValueError, match="not a JSON object"):
+            _parse_batch_judge_response(challenge, json.dumps({"runs": [{}, "n/a"]}), 2)
+
+
 # ── Report generation ──
 
 
@@ -226,6 +347,16 @@ class TestReports:
         assert len(data["results"]) == 2
         assert data["summary"]["total_results"] == 2
 
+    def test_json_report_summary_stats(self, sample_results: list[EvalResult]):
+        summary = json.loads(json_report(sample_results))["summary"]
+        assert summary["with_skill"] == {"count": 1, "avg_score": 2.0, "pass_rate": 1.0}
+        assert summary["baseline"] == {"count": 1, "avg_score": 0.0, "pass_rate": 0.0}
+
+    def test_json_report_summary_empty(self):
+        summary = json.loads(json_report([]))["summary"]
+        assert summary["total_results"] == 0
+        assert summary["with_skill"] == {"count": 0, "avg_score": 0.0, "pass_rate": 0.0}
+
     def test_markdown_report(self, sample_results: list[EvalResult]):
         report = markdown_report(sample_results)
         assert "# Skill Evaluation Report" in report
@@ -157,6 +157,16 @@ class TestParseSkill:
         with pytest.raises(AttributeError):
             skill.name = "changed"  # type: ignore[misc]
 
+    def test_reparse_is_cached_until_edited(self, tmp_path):
+        skill_file = tmp_path / "SKILL.md"
+        skill_file.write_text("---\nname: test\ndescription: Test\n---\n\n# Test\n")
+
+        first = parse_skill(skill_file)
+        assert parse_skill(skill_file) is first
+
+        skill_file.write_text("---\nname: renamed\ndescription: Test\n---\n\n# Test\n")
+        assert parse_skill(skill_file).name == "renamed"
+
 
 class TestDiscoverSkills:
     """Tests for skill discovery."""
@@ -117,15 +117,10 @@ class TestCrossReferences:
                 f"{skill.path}: extends '{skill.extends}' but {target_dir}/SKILL.md not found"
             )
 
-    def test_registered_in_setup(self, skill: ParsedSkill):
+    def test_registered_in_setup(self, skill: ParsedSkill, setup_source: str):
         """Skills should be registered in setup.py SKILLS list."""
-        setup_path = REPO_ROOT / "tools" / "setup.py"
-        if not setup_path.exists():
-            pytest.skip("setup.py not found")
-
-        setup_content = setup_path.read_text(encoding="utf-8")
         # Check the skill name appears in SKILLS list
-        assert f'"{skill.name}"' in setup_content, (
+        assert f'"{skill.name}"' in setup_source, (
             f"{skill.path}: skill '{skill.name}' not registered in setup.py SKILLS list"
         )
 
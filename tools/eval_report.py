@@ -160,19 +160,37 @@ def _result_to_dict(result: EvalResult) -> dict:
     }
 
 
+def _rollup(results: list[EvalResult]) -> dict[bool, tuple[int, int, int]]:
+    """Tally (count, score_sum, pass_count) keyed by whether a skill was used.
+
+    Single pass over results so summaries over large suites don't re-walk
+    the list once per statistic.
+    """
+    count = {True: 0, False: 0}
+    score_sum = {True: 0, False: 0}
+    pass_count = {True: 0, False: 0}
+    for r in results:
+        key = r.skill_used is not None
+        count[key] += 1
+        score_sum[key] += r.total_score
+        pass_count[key] += r.passed
+    return {key: (count[key], score_sum[key], pass_count[key]) for key in (True, False)}
+
+
+def _group_stats(count: int, score_sum: int, pass_count: int) -> dict:
+    """Format one rollup bucket as summary statistics."""
+    return {
+        "count": count,
+        "avg_score": round(score_sum / count, 2) if count else 0.0,
+        "pass_rate": round(pass_count / count, 2) if count else 0.0,
+    }
+
+
 def _summary(results: list[EvalResult]) -> dict:
     """Generate summary statistics."""
-    with_skill, baseline = _split_by_skill(results)
+    rollup = _rollup(results)
     return {
         "total_results": len(results),
-        "with_skill": {
-            "count": len(with_skill),
-            "avg_score": round(_avg_score(with_skill), 2),
-            "pass_rate": round(_pass_rate(with_skill), 2),
-        },
-        "baseline": {
-            "count": len(baseline),
-            "avg_score": round(_avg_score(baseline), 2),
-            "pass_rate": round(_pass_rate(baseline), 2),
-        },
+        "with_skill": _group_stats(*rollup[True]),
+        "baseline": _group_stats(*rollup[False]),
     }
@@ -6,13 +6,19 @@ and evaluation results.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Rubric:
     """Scoring rubric for a challenge problem."""
 
@@ -23,7 +29,7 @@ class Rubric:
     outcome_elements: dict[str, str] = None  # id -> description (process-blind: tests decision quality)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Challenge:
     """A challenge problem for evaluating skill effectiveness."""
 
@@ -35,7 +41,7 @@ class Challenge:
     skill: str | None = None  # Target skill to test (None = baseline)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElementScore:
     """Score for a single binary rubric element (present/absent)."""
 
@@ -44,7 +50,7 @@ class ElementScore:
     evidence: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DepthScore:
     """Score for a single depth rubric element (0-3 scale)."""
 
@@ -53,7 +59,7 @@ class DepthScore:
     evidence: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutcomeScore:
     """Score for a process-blind outcome element (Y/N: did the response change the decision?)."""
 
@@ -62,7 +68,7 @@ class OutcomeScore:
     evidence: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvalResult:
     """Result of evaluating a response against a rubric."""
 
@@ -89,11 +95,27 @@ def load_challenge(path: Path) -> Challenge:
         FileNotFoundError: If path does not exist.
         ValueError: If required fields are missing.
     """
-    if not path.exists():
-        raise FileNotFoundError(f"Challenge file not found: {path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Challenge file not found: {path}") from None
+
+    return _load_challenge_cached(path, st.st_mtime_ns, st.st_size)
+
 
-    content = path.read_text(encoding="utf-8")
-    data = yaml.safe_load(content)
+@functools.lru_cache(maxsize=512)
+def _load_challenge_cached(path: Path, mtime_ns: int, size: int) -> Challenge:
+    """Parse a challenge file; keyed on mtime/size so edited files are re-read."""
+    return parse_challenge(path.read_text(encoding="utf-8"), path)
+
+
+def parse_challenge(content: str, path: Path) -> Challenge:
+    """Parse challenge YAML text already read from ``path``.
+
+    Raises:
+        ValueError: If required fields are missing.
+    """
+    data = yaml.load(content, Loader=_YamlLoader)
 
     if not isinstance(data, dict):
         raise ValueError(f"Challenge file must be a YAML mapping: {path}")
@@ -136,6 +158,11 @@ def load_challenges(directory: Path) -> list[Challenge]:
     return challenges
 
 
+def load_challenges_from_texts(texts: dict[Path, str]) -> list[Challenge]:
+    """Parse prefetched challenge files, in the same order as load_challenges."""
+    return [parse_challenge(texts[path], path) for path in sorted(texts)]
+
+
 def score_response(
     challenge: Challenge,
     element_scores: list[ElementScore],
@@ -151,8 +178,13 @@ def score_response(
     Depth scores (0-3 per element) and outcome scores (met/not met) are tracked
     separately and do not affect pass/fail.
     """
-    score = sum(1 for e in element_scores if e.present)
-    score -= sum(2 for a in anti_pattern_scores if a.present)
+    score = 0
+    for e in element_scores:
+        if e.present:
+            score += 1
+    for a in anti_pattern_scores:
+        if a.present:
+            score -= 2
 
     depth_scores = depth_scores or []
     depth_total = sum(d.score for d in depth_scores)
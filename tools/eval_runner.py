@@ -18,8 +18,7 @@ from skill_parser import parse_skill
 JUDGE_MODEL = "opus"
 SUBJECT_MODEL = "opus"
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunConfig:
     """Configuration for an evaluation run."""
 
@@ -28,6 +27,7 @@ class RunConfig:
     runs_per_challenge: int = 3
     subject_model: str = SUBJECT_MODEL
     judge_model: str = JUDGE_MODEL
+    judge_batch_chars: int = 60_000  # max combined response chars per batched judge call
 
 
 def _claude_cli(prompt: str, model: str = "opus") -> str:
@@ -132,6 +132,53 @@ Respond with ONLY valid JSON in this exact format:
 }}"""
 
 
+def _build_batch_judge_prompt(challenge: Challenge, responses: list[str]) -> str:
+    """Build one binary-judge prompt that scores several responses at once.
+
+    The challenge and rubric are sent once; each response is scored
+    independently and returned as one entry of a ``runs`` list, in order.
+    """
+    elements_desc = "\n".join(
+        f"  - {eid}: {desc}" for eid, desc in challenge.rubric.required_elements.items()
+    )
+    anti_desc = "\n".join(
+        f"  - {aid}: {desc}" for aid, desc in challenge.rubric.anti_patterns.items()
+    )
+    responses_desc = "\n\n".join(
+        f"## Response {i}\n{response}" for i, response in enumerate(responses, 1)
+    )
+
+    return f"""You are evaluating {len(responses)} independent AI responses against a rubric. Score each response on its own, as present or absent per element. Do not compare responses with each other.
+
+## Challenge
+{challenge.prompt}
+
+{responses_desc}
+
+## Required elements (score each as present/absent with evidence)
+{elements_desc}
+
+## Anti-patterns (score each as present/absent with evidence)
+{anti_desc}
+
+Respond with ONLY valid JSON in this exact format, with exactly {len(responses)} entries in "runs" (one per response, in order):
+{{
+  "runs": [
+    {{
+      "elements": {{
+        "<element_id>": {{"present": true/false, "evidence": "brief quote or explanation"}},
+        ...
+      }},
+      "anti_patterns": {{
+        "<pattern_id>": {{"present": true/false, "evidence": "brief quote or explanation"}},
+        ...
+      }}
+    }},
+    ...
+  ]
+}}"""
+
+
 def _build_depth_judge_prompt(challenge: Challenge, response: str) -> str:
     """Build a separate prompt for depth scoring (0-3 scale).
 
@@ -174,10 +221,44 @@ def _parse_judge_response(
     """Parse the binary judge's JSON response into ElementScores."""
     text = _extract_json(judge_text)
     data = json.loads(text)
+    return _judge_scores_from_data(challenge, data)
+
+
+def _parse_batch_judge_response(
+    challenge: Challenge, judge_text: str, count: int
+) -> list[tuple[list[ElementScore], list[ElementScore]]]:
+    """Parse a batched judge response into one (elements, anti) pair per response.
+
+    Raises:
+        ValueError: If the judge did not return exactly ``count`` runs.
+    """
+    text = _extract_json(judge_text)
+    data = json.loads(text)
+
+    runs = data.get("runs") if isinstance(data, dict) else None
+    if not isinstance(runs, list) or len(runs) != count:
+        got = len(runs) if isinstance(runs, list) else 0
+        raise ValueError(f"Batch judge returned {got} runs, expected {count}")
+
+    if not all(isinstance(run, dict) for run in runs):
+        raise ValueError("Batch judge returned a run that is not a JSON object")
+
+    return [_judge_scores_from_data(challenge, run) for run in runs]
+
+
+def _judge_scores_from_data(
+    challenge: Challenge, data: dict
+) -> tuple[list[ElementScore], list[ElementScore]]:
+    """Build ElementScores for one response from decoded judge JSON."""
+    elements_map = data.get("elements") or {}
+    anti_map = data.get("anti_patterns") or {}
 
     element_scores: list[ElementScore] = []
     for eid in challenge.rubric.required_elements:
-        entry = data.get("elements", {}).get(eid, {})
+        entry = elements_map.get(eid)
+        if entry is None:
+            element_scores.append(ElementScore(element_id=eid, present=False))
+            continue
         element_scores.append(
             ElementScore(
                 element_id=eid,
@@ -188,7 +269,10 @@ def _parse_judge_response(
 
     anti_scores: list[ElementScore] = []
     for aid in challenge.rubric.anti_patterns:
-        entry = data.get("anti_patterns", {}).get(aid, {})
+        entry = anti_map.get(aid)
+        if entry is None:
+            anti_scores.append(ElementScore(element_id=aid, present=False))
+            continue
         anti_scores.append(
             ElementScore(
                 element_id=aid,
@@ -280,19 +364,64 @@ def _extract_json(text: str) -> str:
     return text
 
 
-def run_single_eval(
+def _judge_batches(responses: list[str], max_chars: int) -> list[list[str]]:
+    """Group responses into consecutive batches of at most ``max_chars`` characters.
+
+    A response larger than the budget gets a batch of its own.
+    """
+    batches: list[list[str]] = []
+    current: list[str] = []
+    size = 0
+    for response in responses:
+        if current and size + len(response) > max_chars:
+            batches.append(current)
+            current, size = [], 0
+        current.append(response)
+        size += len(response)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _judge_responses(
     challenge: Challenge,
-    skill_content: str | None,
+    responses: list[str],
     config: RunConfig,
-) -> EvalResult:
-    """Run a single evaluation: subject responds, judge scores."""
-    subject_prompt = _build_subject_prompt(challenge, skill_content)
-    response = _claude_cli(subject_prompt, config.subject_model)
-
-    judge_prompt = _build_judge_prompt(challenge, response)
-    judge_text = _claude_cli(judge_prompt, config.judge_model)
+) -> list[tuple[list[ElementScore], list[ElementScore]]]:
+    """Score responses with the binary judge, batching several per call.
 
-    element_scores, anti_scores = _parse_judge_response(challenge, judge_text)
+    Callers pass responses from a single mode only, so the judge never sees
+    with-skill and baseline responses side by side. If a batched reply
+    cannot be parsed, that batch's responses are re-judged one at a time, so
+    one malformed reply does not fail every run in it.
+    """
+    def judge_one(response: str) -> tuple[list[ElementScore], list[ElementScore]]:
+        judge_text = _claude_cli(_build_judge_prompt(challenge, response), config.judge_model)
+        return _parse_judge_response(challenge, judge_text)
+
+    judged: list[tuple[list[ElementScore], list[ElementScore]]] = []
+    for batch in _judge_batches(responses, config.judge_batch_chars):
+        if len(batch) == 1:
+            judged.append(judge_one(batch[0]))
+            continue
+        judge_prompt = _build_batch_judge_prompt(challenge, batch)
+        judge_text = _claude_cli(judge_prompt, config.judge_model)
+        try:
+            judged.extend(_parse_batch_judge_response(challenge, judge_text, len(batch)))
+        except ValueError:
+            judged.extend(judge_one(response) for response in batch)
+    return judged
+
+
+def _finish_eval(
+    challenge: Challenge,
+    response: str,
+    judged: tuple[list[ElementScore], list[ElementScore]],
+    skill_used: str | None,
+    config: RunConfig,
+) -> EvalResult:
+    """Run the depth/outcome judges for a response and assemble its EvalResult."""
+    element_scores, anti_scores = judged
 
     # Separate depth judge call (avoids halo effect from binary scoring)
     depth_scores = []
@@ -312,7 +441,7 @@ def run_single_eval(
         challenge,
         element_scores,
         anti_scores,
-        skill_used=challenge.skill,
+        skill_used=skill_used,
         raw_response=response,
         depth_scores=depth_scores,
         outcome_scores=outcome_scores,
@@ -325,10 +454,11 @@ def run_challenge(
 ) -> list[EvalResult]:
     """Run a challenge multiple times and return all results.
 
-    Runs both with and without the skill for A/B comparison.
+    Runs both with and without the skill for A/B comparison. All subject
+    responses are collected first so the binary judge can score them in
+    batches (see ``RunConfig.judge_batch_chars``); each mode is batched
+    separately so the two arms are never judged in the same prompt.
     """
-    results: list[EvalResult] = []
-
     # Load skill content if specified
     skill_content: str | None = None
     if challenge.skill:
@@ -337,25 +467,25 @@ def run_challenge(
             skill = parse_skill(skill_path)
             skill_content = skill.body
 
+    with_prompt = _build_subject_prompt(challenge, skill_content)
+    baseline_prompt = _build_subject_prompt(challenge, None)
+
+    with_responses: list[str] = []
+    baseline_responses: list[str] = []
     for _ in range(config.runs_per_challenge):
-        # Run with skill
-        result_with = run_single_eval(challenge, skill_content, config)
-        results.append(result_with)
-
-        # Run baseline (without skill)
-        baseline = run_single_eval(challenge, None, config)
-        results.append(
-            EvalResult(
-                challenge_id=baseline.challenge_id,
-                skill_used=None,
-                element_scores=baseline.element_scores,
-                anti_pattern_scores=baseline.anti_pattern_scores,
-                total_score=baseline.total_score,
-                passed=baseline.passed,
-                raw_response=baseline.raw_response,
-            )
-        )
+        with_responses.append(_claude_cli(with_prompt, config.subject_model))
+        baseline_responses.append(_claude_cli(baseline_prompt, config.subject_model))
+
+    with_judged = _judge_responses(challenge, with_responses, config)
+    baseline_judged = _judge_responses(challenge, baseline_responses, config)
 
+    # Results stay interleaved per run: with-skill, then baseline
+    results: list[EvalResult] = []
+    for run in range(config.runs_per_challenge):
+        results.append(_finish_eval(
+            challenge, with_responses[run], with_judged[run], challenge.skill, config))
+        results.append(_finish_eval(
+            challenge, baseline_responses[run], baseline_judged[run], None, config))
     return results
 
 
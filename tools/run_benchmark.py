@@ -8,25 +8,44 @@ Usage:
     python3 tools/run_benchmark.py --runs 2
     python3 tools/run_benchmark.py --skill megamind-deep --runs 2
     python3 tools/run_benchmark.py --save results/baseline.json
+    python3 tools/run_benchmark.py --cache --runs 2   # reuse responses from earlier sweeps
+    python3 tools/run_benchmark.py --max-runs 5 --var-threshold 0.5   # stop stable combos early
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
+import functools
+import hashlib
 import json
 import math
+import mmap
 import os
 import shutil
-import subprocess
 import sys
+import tempfile
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, defaultdict, deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import BinaryIO
 
 # Add tools to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from eval_rubric import Challenge, EvalResult, load_challenges, score_response
+from eval_rubric import (
+    Challenge,
+    DepthScore,
+    ElementScore,
+    EvalResult,
+    OutcomeScore,
+    load_challenges_from_texts,
+    score_response,
+)
 from eval_runner import (
     _build_depth_judge_prompt,
     _build_judge_prompt,
@@ -38,9 +57,15 @@ from eval_runner import (
 )
 from skill_parser import parse_skill
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 REPO_ROOT = Path(__file__).parent.parent
 SKILLS_DIR = REPO_ROOT / "skills"
 CHALLENGES_DIR = REPO_ROOT / "tests" / "challenges"
+CACHE_DIR = Path(os.environ.get("BENCH_CACHE_DIR", REPO_ROOT / ".benchmark-cache"))
 
 SUBJECT_MODEL = "claude-opus-4-6-20250929"
 JUDGE_MODEL = "claude-opus-4-6-20250929"
@@ -54,84 +79,323 @@ def label(skill: str | None) -> str:
     return skill or "baseline"
 
 
+def _read_challenge_files(directory: Path) -> dict[Path, str]:
+    """Read every challenge file concurrently, so parsing never waits on disk."""
+    if not directory.is_dir():
+        return {}
+    paths = list(directory.glob("*.yaml"))
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        texts = pool.map(functools.partial(Path.read_text, encoding="utf-8"), paths)
+        return dict(zip(paths, texts, strict=True))
+
+
+@functools.lru_cache(maxsize=8)
 def load_skill_content(skill_name: str) -> str | None:
+    """Return the body of a skill's SKILL.md; read once per process."""
     path = SKILLS_DIR / skill_name / "SKILL.md"
     if not path.exists():
         return None
     return parse_skill(path).body
 
 
-def _claude_cli(prompt: str, model: str = "opus") -> str:
-    """Run a prompt through the claude CLI in non-interactive mode.
-
-    Uses --output-format json for structured output and --permission-mode
-    bypassPermissions for non-interactive / CI use.
-    """
+@functools.lru_cache(maxsize=1)
+def _claude_bin() -> str:
+    """Resolve the claude binary once per process."""
     claude_bin = shutil.which("claude")
     if not claude_bin:
         raise RuntimeError("claude CLI not found in PATH")
+    return claude_bin
+
+
+@functools.lru_cache(maxsize=4)
+def _cli_args(model: str) -> tuple[str, ...]:
+    """Argument vector for a non-interactive claude CLI call."""
+    return (
+        _claude_bin(),
+        "--print",
+        "--output-format", "json",
+        "--model", model,
+        "--no-session-persistence",
+        "--permission-mode", "bypassPermissions",
+        "--tools", "",
+    )
+
 
+@functools.lru_cache(maxsize=1)
+def _cli_env() -> dict[str, str]:
+    """Child environment for the CLI, computed once per process."""
     # Strip ANTHROPIC_API_KEY so the CLI uses OAuth, not a potentially stale key
-    env = {k: v for k, v in os.environ.items() if k != "ANTHROPIC_API_KEY"}
-
-    result = subprocess.run(
-        [
-            claude_bin,
-            "--print",
-            "--output-format", "json",
-            "--model", model,
-            "--no-session-persistence",
-            "--permission-mode", "bypassPermissions",
-            "--tools", "",
-        ],
-        input=prompt,
-        capture_output=True,
-        text=True,
-        timeout=1200,
-        env=env,
-    )
+    return {k: v for k, v in os.environ.items() if k != "ANTHROPIC_API_KEY"}
+
+
+_PIPE_CHUNK = 1 << 16  # bytes per pipe read; also the StreamReader buffer limit
+_STDIN_FILE_MIN = 16 << 10  # prompts this large reach the CLI through a file, not a pipe
+
+
+def _prompt_file(data: bytes) -> BinaryIO:
+    """Return a rewound file holding ``data``; an anonymous memfd where available."""
+    if hasattr(os, "memfd_create"):
+        f = os.fdopen(os.memfd_create("claude-prompt", os.MFD_CLOEXEC), "w+b")
+    else:
+        f = tempfile.TemporaryFile()
+    f.write(data)
+    f.seek(0)
+    return f
 
-    if result.returncode != 0:
-        raise RuntimeError(f"claude CLI failed: {result.stderr.strip()}")
+
+async def _feed(stream: asyncio.StreamWriter, data: bytes) -> None:
+    """Write the prompt to the child's stdin and close it.
+
+    A child that exits without reading all of it closes the pipe; that is
+    not an error here, its exit status and stderr say what went wrong.
+    """
+    try:
+        stream.write(data)
+        await stream.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        pass
+    stream.close()
+
+
+async def _drain(stream: asyncio.StreamReader) -> bytes:
+    """Read a child pipe to EOF in large chunks, as they arrive."""
+    buf = bytearray()
+    while chunk := await stream.read(_PIPE_CHUNK):
+        buf += chunk
+    return bytes(buf)
+
+
+async def _claude_cli(prompt: str, model: str = "opus") -> str:
+    """Run a prompt through the claude CLI in non-interactive mode.
+
+    Uses --output-format json for structured output and --permission-mode
+    bypassPermissions for non-interactive / CI use. The CLI runs as an asyncio
+    subprocess so many calls can be in flight from a single thread; stdout is
+    consumed as it is produced and decoded once at the end.
+    """
+    data = prompt.encode("utf-8")
+    # Large prompts go in a single write to a file the child reads as stdin
+    stdin_file = _prompt_file(data) if len(data) >= _STDIN_FILE_MIN else None
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *_cli_args(model),
+            stdin=stdin_file or asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=_cli_env(),
+            limit=_PIPE_CHUNK,
+        )
+    finally:
+        if stdin_file:
+            stdin_file.close()
+    readers = [_drain(proc.stdout), _drain(proc.stderr)]
+    if stdin_file is None:
+        readers.append(_feed(proc.stdin, data))
+    try:
+        stdout_b, stderr_b, *_ = await asyncio.wait_for(asyncio.gather(*readers), timeout=1200)
+        await proc.wait()
+    finally:
+        # Timeout, cancellation or a failed reader: never leave the child running
+        if proc.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            await proc.wait()
+    stdout = stdout_b.decode("utf-8", errors="replace")
+
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"claude CLI failed: {stderr_b.decode('utf-8', errors='replace').strip()}"
+        )
 
     # --output-format json wraps the response in a JSON object
     try:
-        data = json.loads(result.stdout)
+        data = json.loads(stdout)
         # The JSON format returns {"type": "result", "result": "..."}
         if isinstance(data, dict) and "result" in data:
             return data["result"].strip()
         # Fallback: if format differs, return raw text content
-        return result.stdout.strip()
+        return stdout.strip()
     except json.JSONDecodeError:
         # Fallback for non-JSON output
-        return result.stdout.strip()
+        return stdout.strip()
 
 
-def run_one(challenge: Challenge, skill_name: str | None) -> EvalResult:
-    """Run a single challenge with a single skill mode via claude CLI."""
-    skill_content = load_skill_content(skill_name) if skill_name else None
-    subject_prompt = _build_subject_prompt(challenge, skill_content)
+class ResponseCache:
+    """Content-addressed on-disk cache of claude CLI responses.
 
-    response = _claude_cli(subject_prompt)
+    Entries live in ``<directory>/<sha256>.json`` keyed by model, prompt and
+    an optional salt. Failed calls raise before anything is stored and empty
+    responses are never cached.
+    """
 
-    judge_prompt = _build_judge_prompt(challenge, response)
-    judge_text = _claude_cli(judge_prompt)
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
 
-    element_scores, anti_scores = _parse_judge_response(challenge, judge_text)
+    def _path(self, model: str, prompt: str, salt: str) -> Path:
+        digest = hashlib.sha256(f"{model}\0{salt}\0{prompt}".encode()).hexdigest()
+        return self.directory / f"{digest}.json"
 
-    # Separate depth judge call (avoids halo effect from binary scoring)
-    depth_scores = []
-    if challenge.rubric.depth_elements:
-        depth_prompt = _build_depth_judge_prompt(challenge, response)
-        depth_text = _claude_cli(depth_prompt)
-        depth_scores = _parse_depth_response(challenge, depth_text)
+    def get(self, prompt: str, model: str = "opus", salt: str = "") -> str | None:
+        """Return the cached response for this prompt, or None on a miss."""
+        try:
+            return json.loads(self._path(model, prompt, salt).read_text(encoding="utf-8"))["response"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, prompt: str, response: str, model: str = "opus", salt: str = "") -> None:
+        """Store a successful, non-empty response."""
+        if not response:
+            return
+        path = self._path(model, prompt, salt)
+        entry = {"model": model, "prompt": prompt, "response": response, "ts": time.time()}
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry), encoding="utf-8")
+        tmp.replace(path)
+
+    def discard(self, prompt: str, model: str = "opus", salt: str = "") -> None:
+        """Drop a stored response, e.g. one its caller could not parse."""
+        self._path(model, prompt, salt).unlink(missing_ok=True)
+
+
+class JudgeVerdictCache:
+    """Reuse binary-judge verdicts for near-duplicate responses to a challenge.
+
+    Similarity is the Jaccard index over word trigrams. Entries are namespaced
+    by challenge id and rubric ids, so a verdict can never be reused for a
+    different challenge or a changed rubric.
+    """
+
+    def __init__(self, threshold: float) -> None:
+        self.threshold = threshold
+        self._entries: dict[tuple, list[tuple[frozenset, str]]] = {}
+
+    @staticmethod
+    def _namespace(challenge: Challenge) -> tuple:
+        rubric = challenge.rubric
+        return (challenge.id, tuple(rubric.required_elements), tuple(rubric.anti_patterns))
+
+    @staticmethod
+    def _shingles(text: str) -> frozenset:
+        words = text.lower().split()
+        if len(words) < 3:
+            return frozenset((w,) for w in words)
+        return frozenset(zip(words, words[1:], words[2:], strict=False))
+
+    def lookup(self, challenge: Challenge, response: str) -> str | None:
+        """Return the verdict of the most similar prior response above threshold."""
+        shingles = self._shingles(response)
+        best_score, best_text = 0.0, None
+        for other, judge_text in self._entries.get(self._namespace(challenge), ()):
+            union = len(shingles | other)
+            score = len(shingles & other) / union if union else 1.0
+            if score > best_score:
+                best_score, best_text = score, judge_text
+        return best_text if best_score >= self.threshold else None
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def store(self, challenge: Challenge, response: str, judge_text: str) -> None:
+        entry = (self._shingles(response), judge_text)
+        self._entries.setdefault(self._namespace(challenge), []).append(entry)
+
+
+# Subject prompt memo keyed on challenge id: Challenge itself is unhashable
+# (dict fields). Bounded by challenges x skill modes.
+_subject_prompts: dict[tuple[str, str | None], str] = {}
+
+
+def _subject_prompt(challenge: Challenge, skill_name: str | None) -> str:
+    """Memoized _build_subject_prompt; identical for every run of a combo."""
+    key = (challenge.id, skill_name)
+    prompt = _subject_prompts.get(key)
+    if prompt is None:
+        skill_content = load_skill_content(skill_name) if skill_name else None
+        prompt = _subject_prompts[key] = _build_subject_prompt(challenge, skill_content)
+    return prompt
+
+
+async def _llm(prompt: str, cache: ResponseCache | None, salt: str = "") -> str:
+    """Run a prompt through the claude CLI, via the response cache if enabled."""
+    if cache is None:
+        return await _claude_cli(prompt)
+    response = cache.get(prompt, salt=salt)
+    if response is None:
+        response = await _claude_cli(prompt)
+        cache.put(prompt, response, salt=salt)
+    return response
+
+
+@contextlib.contextmanager
+def _evict_on_error(cache: ResponseCache | None, prompt: str | None) -> Iterator[None]:
+    """Drop prompt's cached response if parsing it raises inside the block.
+
+    The cache only rejects empty text, so a truncated or non-JSON judge
+    reply would otherwise fail that combo on every later --cache run.
+    """
+    try:
+        yield
+    except Exception:
+        if cache is not None and prompt is not None:
+            cache.discard(prompt)
+        raise
+
+
+async def run_one(
+    challenge: Challenge,
+    skill_name: str | None,
+    *,
+    cache: ResponseCache | None = None,
+    verdicts: JudgeVerdictCache | None = None,
+    run_idx: int = 0,
+    subject_slots: asyncio.Semaphore | None = None,
+    judge_slots: asyncio.Semaphore | None = None,
+) -> EvalResult:
+    """Run a single challenge with a single skill mode via claude CLI.
+
+    With a cache, subject responses are keyed per run index so repeated runs
+    within one sweep stay independent samples, while a re-executed sweep
+    reuses them. Judge prompts embed the response, so they key on content.
+    With ``verdicts``, a near-duplicate response reuses an earlier binary
+    judge verdict instead of calling the judge again.
+
+    ``subject_slots`` and ``judge_slots`` bound the subject and judge phases
+    separately, so this combo's judges run while other combos' subjects do.
+    """
+    subject_prompt = _subject_prompt(challenge, skill_name)
+
+    async with subject_slots or contextlib.nullcontext():
+        response = await _llm(subject_prompt, cache, salt=f"run={run_idx}")
+
+    async with judge_slots or contextlib.nullcontext():
+        judge_text = verdicts.lookup(challenge, response) if verdicts else None
+        judge_prompt = None
+        if judge_text is None:
+            judge_prompt = _build_judge_prompt(challenge, response)
+            judge_text = await _llm(judge_prompt, cache)
+
+        with _evict_on_error(cache, judge_prompt):
+            element_scores, anti_scores = _parse_judge_response(challenge, judge_text)
+        # Only a verdict that parsed may be reused for near-duplicate responses
+        if verdicts and judge_prompt is not None:
+            verdicts.store(challenge, response, judge_text)
+
+        # Separate depth judge call (avoids halo effect from binary scoring)
+        depth_scores = []
+        if challenge.rubric.depth_elements:
+            depth_prompt = _build_depth_judge_prompt(challenge, response)
+            depth_text = await _llm(depth_prompt, cache)
+            with _evict_on_error(cache, depth_prompt):
+                depth_scores = _parse_depth_response(challenge, depth_text)
 
-    # Separate outcome judge call (process-blind, tests decision quality)
-    outcome_scores = []
-    if challenge.rubric.outcome_elements:
-        outcome_prompt = _build_outcome_judge_prompt(challenge, response)
-        outcome_text = _claude_cli(outcome_prompt)
-        outcome_scores = _parse_outcome_response(challenge, outcome_text)
+        # Separate outcome judge call (process-blind, tests decision quality)
+        outcome_scores = []
+        if challenge.rubric.outcome_elements:
+            outcome_prompt = _build_outcome_judge_prompt(challenge, response)
+            outcome_text = await _llm(outcome_prompt, cache)
+            with _evict_on_error(cache, outcome_prompt):
+                outcome_scores = _parse_outcome_response(challenge, outcome_text)
 
     return score_response(
         challenge, element_scores, anti_scores,
@@ -141,48 +405,86 @@ def run_one(challenge: Challenge, skill_name: str | None) -> EvalResult:
     )
 
 
+# ── Aggregation ──
+
+
+@dataclass(slots=True)
+class ModeStats:
+    """Per-challenge, per-mode tallies shared by the reports and the JSON output."""
+
+    scores: list[int] = field(default_factory=list)
+    passed: list[bool] = field(default_factory=list)
+    elem_hits: Counter[str] = field(default_factory=Counter)
+    anti_hits: Counter[str] = field(default_factory=Counter)
+    depth: dict[str, list[int]] = field(default_factory=dict)
+    depth_totals: list[int] = field(default_factory=list)
+    outcome_met: Counter[str] = field(default_factory=Counter)
+
+
+Aggregates = dict[str, dict[str, ModeStats]]
+
+
+def _aggregate(
+    challenges: list[Challenge],
+    all_results: dict[str, dict[str, list[EvalResult]]],
+    skill_modes: list[str | None],
+) -> Aggregates:
+    """Tally every result in one pass; reports and JSON read only the tallies."""
+    agg: Aggregates = {}
+    for challenge in challenges:
+        challenge_results = all_results.get(challenge.id, {})
+        by_mode = agg[challenge.id] = {}
+        for skill in skill_modes:
+            key = label(skill)
+            stats = by_mode[key] = ModeStats()
+            for r in challenge_results.get(key, []):
+                stats.scores.append(r.total_score)
+                stats.passed.append(r.passed)
+                for e in r.element_scores:
+                    if e.present:
+                        stats.elem_hits[e.element_id] += 1
+                for a in r.anti_pattern_scores:
+                    if a.present:
+                        stats.anti_hits[a.element_id] += 1
+                for d in r.depth_scores:
+                    stats.depth.setdefault(d.element_id, []).append(d.score)
+                stats.depth_totals.append(r.depth_total)
+                for o in r.outcome_scores:
+                    if o.met:
+                        stats.outcome_met[o.element_id] += 1
+    return agg
+
+
 # ── Serialization ──
 
 
 def results_to_json(
     challenges: list[Challenge],
-    all_results: dict[str, dict[str, list[EvalResult]]],
+    agg: Aggregates,
     skill_modes: list[str | None],
 ) -> dict:
-    """Convert results to a JSON-serializable dict."""
+    """Convert aggregated results to a JSON-serializable dict."""
     data: dict = {"challenges": {}, "skill_modes": [label(s) for s in skill_modes]}
     for challenge in challenges:
         cdata: dict = {"name": challenge.name, "modes": {}}
         for skill in skill_modes:
             key = label(skill)
-            results = all_results.get(challenge.id, {}).get(key, [])
+            stats = agg[challenge.id][key]
+            total = len(stats.scores)
             mode_data: dict = {
-                "scores": [r.total_score for r in results],
-                "passed": [r.passed for r in results],
+                "scores": stats.scores,
+                "passed": stats.passed,
                 "elements": {},
                 "anti_patterns": {},
             }
             for eid in challenge.rubric.required_elements:
-                hits = sum(
-                    1 for r in results
-                    for e in r.element_scores
-                    if e.element_id == eid and e.present
-                )
-                mode_data["elements"][eid] = {"hits": hits, "total": len(results)}
+                mode_data["elements"][eid] = {"hits": stats.elem_hits[eid], "total": total}
             for aid in challenge.rubric.anti_patterns:
-                hits = sum(
-                    1 for r in results
-                    for a in r.anti_pattern_scores
-                    if a.element_id == aid and a.present
-                )
-                mode_data["anti_patterns"][aid] = {"hits": hits, "total": len(results)}
+                mode_data["anti_patterns"][aid] = {"hits": stats.anti_hits[aid], "total": total}
             if challenge.rubric.depth_elements:
                 mode_data["depth"] = {}
                 for did in challenge.rubric.depth_elements:
-                    depths = [
-                        d.score for r in results for d in r.depth_scores
-                        if d.element_id == did
-                    ]
+                    depths = stats.depth.get(did, [])
                     mode_data["depth"][did] = {
                         "avg": sum(depths) / len(depths) if depths else 0,
                         "scores": depths,
@@ -192,130 +494,177 @@ def results_to_json(
     return data
 
 
+def _dump_json(data: dict) -> bytes:
+    """Serialize results as indented JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+_MMAP_MIN_BYTES = 50 << 20  # map saved results this large instead of reading them
+
+
 def load_saved_results(path: Path) -> dict:
-    """Load previously saved benchmark results."""
-    return json.loads(path.read_text(encoding="utf-8"))
+    """Load previously saved benchmark results, parsing the raw bytes."""
+    if orjson is None:
+        return json.loads(path.read_bytes())
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return orjson.loads(memoryview(mm))
+
+
+_PARTIAL_FSYNC_EVERY = 10  # completed combos between fsyncs of the partial file
+
+
+def _partial_record(cid: str, key: str, run_idx: int, result: EvalResult) -> bytes:
+    """Serialize one completed combo as a JSONL line for the partial file."""
+    record = {"cid": cid, "key": key, "run_idx": run_idx, "result": asdict(result)}
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record).encode("utf-8") + b"\n"
+
+
+def _result_from_dict(data: dict) -> EvalResult:
+    """Rebuild an EvalResult from its ``asdict`` form."""
+    return EvalResult(
+        **{
+            **data,
+            "element_scores": tuple(ElementScore(**e) for e in data["element_scores"]),
+            "anti_pattern_scores": tuple(ElementScore(**a) for a in data["anti_pattern_scores"]),
+            "depth_scores": tuple(DepthScore(**d) for d in data.get("depth_scores", ())),
+            "outcome_scores": tuple(OutcomeScore(**o) for o in data.get("outcome_scores", ())),
+        }
+    )
 
 
-# ── Reporting ──
+def load_partial_results(path: Path) -> list[tuple[str, str, int, EvalResult]]:
+    """Load combos completed by an interrupted run from its partial JSONL file.
+
+    A truncated trailing line (crash mid-write) is ignored.
+    """
+    if not path.exists():
+        return []
+    done: list[tuple[str, str, int, EvalResult]] = []
+    for line in path.read_bytes().splitlines():
+        try:
+            record = json.loads(line)
+            done.append(
+                (record["cid"], record["key"], record["run_idx"], _result_from_dict(record["result"]))
+            )
+        except (ValueError, KeyError, TypeError):
+            continue
+    return done
 
 
-def print_header(text: str) -> None:
-    print(f"\n{'=' * 80}")
-    print(f"  {text}")
-    print(f"{'=' * 80}")
+# ── Reporting ──
 
 
-def _element_hit_rate(
-    results: list[EvalResult], element_id: str, is_anti: bool = False
-) -> tuple[int, int]:
-    """Return (hits, total) for an element across results."""
-    scores_attr = "anti_pattern_scores" if is_anti else "element_scores"
-    hits = sum(
-        1 for r in results
-        for e in getattr(r, scores_attr)
-        if e.element_id == element_id and e.present
-    )
-    return hits, len(results)
+def _header_lines(text: str) -> list[str]:
+    return ["", "=" * 80, f"  {text}", "=" * 80]
 
 
 def _variance(scores: list[int]) -> float:
-    """Compute variance of scores."""
+    """Compute sample variance of scores (single-pass Welford)."""
     if len(scores) < 2:
         return 0.0
-    avg = sum(scores) / len(scores)
-    return sum((s - avg) ** 2 for s in scores) / (len(scores) - 1)
+    mean = 0.0
+    m2 = 0.0
+    for n, s in enumerate(scores, 1):
+        delta = s - mean
+        mean += delta / n
+        m2 += delta * (s - mean)
+    return m2 / (len(scores) - 1)
 
 
 def print_element_grid(
     challenges: list[Challenge],
-    all_results: dict[str, dict[str, list[EvalResult]]],
+    agg: Aggregates,
     skill_modes: list[str | None],
 ) -> None:
     """Print per-element scoring grid for each challenge."""
+    out: list[str] = []
+    modes = [label(s) for s in skill_modes]
+    col_width = 16
     for challenge in challenges:
-        print_header(f"{challenge.id}: {challenge.name}")
-        print(f"  Category: {challenge.category}")
-        print(f"  Passing score: {challenge.rubric.passing_score}")
-        print()
+        out.extend(_header_lines(f"{challenge.id}: {challenge.name}"))
+        out.append(f"  Category: {challenge.category}")
+        out.append(f"  Passing score: {challenge.rubric.passing_score}")
+        out.append("")
 
-        modes = [label(s) for s in skill_modes]
-        col_width = 16
+        by_mode = agg[challenge.id]
         header = "  Element".ljust(34) + "".join(m.center(col_width) for m in modes)
-        print(header)
-        print("  " + "-" * (32 + col_width * len(modes)))
+        out.append(header)
+        out.append("  " + "-" * (32 + col_width * len(modes)))
 
         # Required elements
         for eid in challenge.rubric.required_elements:
             row = f"  + {eid}".ljust(34)
-            for skill in skill_modes:
-                results = all_results.get(challenge.id, {}).get(label(skill), [])
-                if results:
-                    hits, total = _element_hit_rate(results, eid)
+            for key in modes:
+                stats = by_mode[key]
+                if stats.scores:
+                    hits, total = stats.elem_hits[eid], len(stats.scores)
                     pct = hits / total if total else 0
                     marker = " **" if pct == 0 else ""  # Flag 0% hit rate
                     cell = f"{hits}/{total} ({pct:.0%}){marker}"
                 else:
                     cell = "-"
                 row += cell.center(col_width)
-            print(row)
+            out.append(row)
 
         # Anti-patterns
         if challenge.rubric.anti_patterns:
-            print()
+            out.append("")
             for aid in challenge.rubric.anti_patterns:
                 row = f"  ! {aid}".ljust(34)
-                for skill in skill_modes:
-                    results = all_results.get(challenge.id, {}).get(label(skill), [])
-                    if results:
-                        hits, total = _element_hit_rate(results, aid, is_anti=True)
+                for key in modes:
+                    stats = by_mode[key]
+                    if stats.scores:
+                        hits, total = stats.anti_hits[aid], len(stats.scores)
                         pct = hits / total if total else 0
                         marker = " !!" if pct == 1.0 else ""  # Flag 100% anti-pattern
                         cell = f"{hits}/{total} ({pct:.0%}){marker}"
                     else:
                         cell = "-"
                     row += cell.center(col_width)
-                print(row)
+                out.append(row)
 
         # Score + variance
-        print()
+        out.append("")
         row = "  SCORE (avg)".ljust(34)
-        for skill in skill_modes:
-            results = all_results.get(challenge.id, {}).get(label(skill), [])
-            if results:
-                scores = [r.total_score for r in results]
+        for key in modes:
+            scores = by_mode[key].scores
+            if scores:
                 avg = sum(scores) / len(scores)
                 var = _variance(scores)
                 cell = f"{avg:.1f} (var={var:.1f})"
             else:
                 cell = "-"
             row += cell.center(col_width)
-        print(row)
+        out.append(row)
 
         row = "  PASS RATE".ljust(34)
-        for skill in skill_modes:
-            results = all_results.get(challenge.id, {}).get(label(skill), [])
-            if results:
-                rate = sum(1 for r in results if r.passed) / len(results)
+        for key in modes:
+            passed = by_mode[key].passed
+            if passed:
+                rate = sum(passed) / len(passed)
                 cell = f"{rate:.0%}"
             else:
                 cell = "-"
             row += cell.center(col_width)
-        print(row)
+        out.append(row)
 
         # Depth scores (only if challenge has depth_elements)
         if challenge.rubric.depth_elements:
-            print()
-            print("  DEPTH (0-3 scale, indicative — average across runs):")
+            out.append("")
+            out.append("  DEPTH (0-3 scale, indicative — average across runs):")
             for did in challenge.rubric.depth_elements:
                 row = f"  ~ {did}".ljust(34)
-                for skill in skill_modes:
-                    results = all_results.get(challenge.id, {}).get(label(skill), [])
-                    if results:
-                        depths = [
-                            d.score for r in results for d in r.depth_scores
-                            if d.element_id == did
-                        ]
+                for key in modes:
+                    stats = by_mode[key]
+                    if stats.scores:
+                        depths = stats.depth.get(did)
                         if depths:
                             avg_d = sum(depths) / len(depths)
                             cell = f"{avg_d:.1f}/3"
@@ -324,186 +673,180 @@ def print_element_grid(
                     else:
                         cell = "-"
                     row += cell.center(col_width)
-                print(row)
+                out.append(row)
 
             row = "  DEPTH TOTAL (avg)".ljust(34)
-            for skill in skill_modes:
-                results = all_results.get(challenge.id, {}).get(label(skill), [])
-                if results:
-                    totals = [r.depth_total for r in results]
+            for key in modes:
+                totals = by_mode[key].depth_totals
+                if totals:
                     max_depth = len(challenge.rubric.depth_elements) * 3
-                    avg_t = sum(totals) / len(totals) if totals else 0
+                    avg_t = sum(totals) / len(totals)
                     cell = f"{avg_t:.1f}/{max_depth}"
                 else:
                     cell = "-"
                 row += cell.center(col_width)
-            print(row)
+            out.append(row)
 
         # Outcome scores (process-blind, only if challenge has outcome_elements)
         if challenge.rubric.outcome_elements:
-            print()
-            print("  OUTCOMES (process-blind — did it change the decision?):")
+            out.append("")
+            out.append("  OUTCOMES (process-blind — did it change the decision?):")
             for oid in challenge.rubric.outcome_elements:
                 row = f"  * {oid}".ljust(34)
-                for skill in skill_modes:
-                    results = all_results.get(challenge.id, {}).get(label(skill), [])
-                    if results:
-                        met = sum(
-                            1 for r in results for o in r.outcome_scores
-                            if o.element_id == oid and o.met
-                        )
-                        total = len(results)
-                        cell = f"{met}/{total}"
+                for key in modes:
+                    stats = by_mode[key]
+                    if stats.scores:
+                        cell = f"{stats.outcome_met[oid]}/{len(stats.scores)}"
                     else:
                         cell = "-"
                     row += cell.center(col_width)
-                print(row)
+                out.append(row)
+
+        out.append("")
 
-        print()
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def print_summary_table(
     challenges: list[Challenge],
-    all_results: dict[str, dict[str, list[EvalResult]]],
+    agg: Aggregates,
     skill_modes: list[str | None],
 ) -> None:
     """Print overall summary comparison table."""
-    print_header("OVERALL SUMMARY")
+    out: list[str] = []
+    out.extend(_header_lines("OVERALL SUMMARY"))
 
     col_width = 16
-    modes = [label(s) for s in skill_modes]
+    modes = tuple(label(s) for s in skill_modes)
     header = "  Metric".ljust(28) + "".join(m.center(col_width) for m in modes)
-    print(header)
-    print("  " + "-" * (26 + col_width * len(modes)))
+    out.append(header)
+    out.append("  " + "-" * (26 + col_width * len(modes)))
+
+    # Flatten scores/pass flags per mode across challenges
+    per_mode_scores: dict[str, list[int]] = {key: [] for key in (*modes, "baseline")}
+    per_mode_passed: dict[str, int] = dict.fromkeys(per_mode_scores, 0)
+    for by_mode in agg.values():
+        for key, stats in by_mode.items():
+            scores = per_mode_scores.get(key)
+            if scores is None:
+                continue
+            scores.extend(stats.scores)
+            per_mode_passed[key] += sum(stats.passed)
+    per_mode_avg = {
+        key: sum(scores) / len(scores) if scores else 0
+        for key, scores in per_mode_scores.items()
+    }
 
     # Avg score
     row = "  Avg Score".ljust(28)
-    for skill in skill_modes:
-        scores = [
-            r.total_score
-            for cid in all_results
-            for r in all_results[cid].get(label(skill), [])
-        ]
-        avg = sum(scores) / len(scores) if scores else 0
-        row += f"{avg:.1f}".center(col_width)
-    print(row)
+    for key in modes:
+        row += f"{per_mode_avg[key]:.1f}".center(col_width)
+    out.append(row)
 
     # Variance
     row = "  Score Variance".ljust(28)
-    for skill in skill_modes:
-        scores = [
-            r.total_score
-            for cid in all_results
-            for r in all_results[cid].get(label(skill), [])
-        ]
+    for key in modes:
+        scores = per_mode_scores[key]
         var = _variance(scores) if scores else 0
         row += f"{var:.1f}".center(col_width)
-    print(row)
+    out.append(row)
 
     # Pass rate
     row = "  Pass Rate".ljust(28)
-    for skill in skill_modes:
-        results = [
-            r for cid in all_results for r in all_results[cid].get(label(skill), [])
-        ]
-        rate = sum(1 for r in results if r.passed) / len(results) if results else 0
+    for key in modes:
+        count = len(per_mode_scores[key])
+        rate = per_mode_passed[key] / count if count else 0
         row += f"{rate:.0%}".center(col_width)
-    print(row)
+    out.append(row)
 
     # Delta vs baseline
-    baseline_scores = [
-        r.total_score
-        for cid in all_results
-        for r in all_results[cid].get("baseline", [])
-    ]
-    baseline_avg = sum(baseline_scores) / len(baseline_scores) if baseline_scores else 0
+    baseline_avg = per_mode_avg["baseline"]
 
     row = "  Delta vs Baseline".ljust(28)
-    for skill in skill_modes:
+    for skill, key in zip(skill_modes, modes, strict=True):
         if skill is None:
             row += "-".center(col_width)
         else:
-            scores = [
-                r.total_score
-                for cid in all_results
-                for r in all_results[cid].get(label(skill), [])
-            ]
-            avg = sum(scores) / len(scores) if scores else 0
-            delta = avg - baseline_avg
+            delta = per_mode_avg[key] - baseline_avg
             sign = "+" if delta >= 0 else ""
             row += f"{sign}{delta:.1f}".center(col_width)
-    print(row)
+    out.append(row)
 
     # Per-challenge breakdown
-    print()
-    print("  Per-challenge scores:")
+    out.append("")
+    out.append("  Per-challenge scores:")
     row = "  Challenge".ljust(28) + "".join(m.center(col_width) for m in modes)
-    print(row)
-    print("  " + "-" * (26 + col_width * len(modes)))
+    out.append(row)
+    out.append("  " + "-" * (26 + col_width * len(modes)))
 
     for challenge in challenges:
         row = f"  {challenge.id}".ljust(28)
-        for skill in skill_modes:
-            results = all_results.get(challenge.id, {}).get(label(skill), [])
-            if results:
-                avg = sum(r.total_score for r in results) / len(results)
+        by_mode = agg[challenge.id]
+        for key in modes:
+            scores = by_mode[key].scores
+            if scores:
+                avg = sum(scores) / len(scores)
                 row += f"{avg:.1f}".center(col_width)
             else:
                 row += "-".center(col_width)
-        print(row)
+        out.append(row)
 
     # Weakness report: elements where any skill scores 0%
-    print()
-    print_header("WEAKNESS REPORT (0% hit rate elements)")
+    out.append("")
+    out.extend(_header_lines("WEAKNESS REPORT (0% hit rate elements)"))
     found_weakness = False
     for challenge in challenges:
-        for skill in skill_modes:
+        for skill, key in zip(skill_modes, modes, strict=True):
             if skill is None:
                 continue
-            results = all_results.get(challenge.id, {}).get(label(skill), [])
-            if not results:
+            stats = agg[challenge.id][key]
+            total = len(stats.scores)
+            if not total:
                 continue
             for eid in challenge.rubric.required_elements:
-                hits, total = _element_hit_rate(results, eid)
-                if hits == 0 and total > 0:
-                    print(f"  {label(skill)} on {challenge.id}: {eid} = 0/{total}")
+                if stats.elem_hits[eid] == 0:
+                    out.append(f"  {key} on {challenge.id}: {eid} = 0/{total}")
                     found_weakness = True
     if not found_weakness:
-        print("  None found!")
+        out.append("  None found!")
 
     # Anti-pattern report: elements where any skill scores 100%
-    print()
-    print_header("ANTI-PATTERN ALERT (100% trigger rate)")
+    out.append("")
+    out.extend(_header_lines("ANTI-PATTERN ALERT (100% trigger rate)"))
     found_alert = False
     for challenge in challenges:
-        for skill in skill_modes:
+        for skill, key in zip(skill_modes, modes, strict=True):
             if skill is None:
                 continue
-            results = all_results.get(challenge.id, {}).get(label(skill), [])
-            if not results:
+            stats = agg[challenge.id][key]
+            total = len(stats.scores)
+            if not total:
                 continue
             for aid in challenge.rubric.anti_patterns:
-                hits, total = _element_hit_rate(results, aid, is_anti=True)
-                if hits == total and total > 0:
-                    print(f"  {label(skill)} on {challenge.id}: {aid} = {hits}/{total}")
+                hits = stats.anti_hits[aid]
+                if hits == total:
+                    out.append(f"  {key} on {challenge.id}: {aid} = {hits}/{total}")
                     found_alert = True
     if not found_alert:
-        print("  None found!")
+        out.append("  None found!")
 
-    print()
+    out.append("")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def print_comparison(current: dict, saved: dict) -> None:
     """Print comparison between current and saved results."""
-    print_header("COMPARISON WITH SAVED BASELINE")
+    out: list[str] = []
+    out.extend(_header_lines("COMPARISON WITH SAVED BASELINE"))
 
     for cid, cdata in current.get("challenges", {}).items():
         saved_cdata = saved.get("challenges", {}).get(cid)
         if not saved_cdata:
-            print(f"\n  {cid}: NEW (no saved baseline)")
+            out.append(f"\n  {cid}: NEW (no saved baseline)")
             continue
 
-        print(f"\n  {cid}: {cdata.get('name', '')}")
+        out.append(f"\n  {cid}: {cdata.get('name', '')}")
         for mode_key, mode_data in cdata.get("modes", {}).items():
             saved_mode = saved_cdata.get("modes", {}).get(mode_key)
             if not saved_mode:
@@ -518,7 +861,7 @@ def print_comparison(current: dict, saved: dict) -> None:
                 continue
 
             sign = "+" if delta >= 0 else ""
-            print(f"    {mode_key}: {sav_avg:.1f} -> {cur_avg:.1f} ({sign}{delta:.1f})")
+            out.append(f"    {mode_key}: {sav_avg:.1f} -> {cur_avg:.1f} ({sign}{delta:.1f})")
 
             # Element-level diffs
             for eid, edata in mode_data.get("elements", {}).items():
@@ -528,26 +871,61 @@ def print_comparison(current: dict, saved: dict) -> None:
                 cur_rate = edata["hits"] / edata["total"] if edata["total"] else 0
                 sav_rate = saved_edata["hits"] / saved_edata["total"] if saved_edata["total"] else 0
                 if abs(cur_rate - sav_rate) > 0.01:
-                    print(f"      {eid}: {sav_rate:.0%} -> {cur_rate:.0%}")
+                    out.append(f"      {eid}: {sav_rate:.0%} -> {cur_rate:.0%}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run megamind skill benchmarks")
-    parser.add_argument("--runs", type=int, default=2, help="Runs per challenge/skill combo")
+    parser.add_argument(
+        "--runs", "--max-runs", type=int, default=2, help="Runs per challenge/skill combo"
+    )
+    parser.add_argument(
+        "--var-threshold", type=float, default=None, metavar="VAR",
+        help="Stop a challenge/skill combo early once its score variance drops below VAR "
+             "(after --min-runs runs); disabled by default",
+    )
+    parser.add_argument(
+        "--min-runs", type=int, default=2,
+        help="Runs per combo before --var-threshold may stop it (default: 2)",
+    )
     parser.add_argument("--challenges", nargs="*", help="Specific challenge IDs to run")
     parser.add_argument("--skill", nargs="*", help="Specific skills to test (always includes baseline)")
     parser.add_argument("--json", action="store_true", help="Output JSON to stdout")
     parser.add_argument("--save", type=str, help="Save results to JSON file")
     parser.add_argument("--compare", type=str, help="Compare with saved baseline JSON")
     parser.add_argument("--workers", type=int, default=1, help="Parallel workers")
+    parser.add_argument(
+        "--cache", action=argparse.BooleanOptionalAction, default=False,
+        help="Reuse CLI responses from earlier sweeps (stored in $BENCH_CACHE_DIR "
+             "or .benchmark-cache/)",
+    )
+    parser.add_argument(
+        "--semantic-cache-threshold", type=float, default=None, metavar="SIM",
+        help="Reuse judge verdicts for responses to the same challenge whose word-trigram "
+             "similarity is at least SIM (0-1]; disabled by default",
+    )
     args = parser.parse_args()
 
+    threshold = args.semantic_cache_threshold
+    if threshold is not None and not 0 < threshold <= 1:
+        parser.error("--semantic-cache-threshold must be in (0, 1]")
+    if args.var_threshold is not None and args.var_threshold < 0:
+        parser.error("--var-threshold must be non-negative")
+    if args.min_runs < 2:
+        parser.error("--min-runs must be at least 2")
+
     if not shutil.which("claude"):
         print("ERROR: claude CLI not found in PATH")
         sys.exit(1)
     print("Backend: claude CLI")
+    cache = ResponseCache(CACHE_DIR) if args.cache else None
+    if cache:
+        print(f"Response cache: {cache.directory}")
+    verdicts = JudgeVerdictCache(threshold) if threshold is not None else None
 
-    challenges = load_challenges(CHALLENGES_DIR)
+    challenges = load_challenges_from_texts(_read_challenge_files(CHALLENGES_DIR))
     if args.challenges:
         challenges = [c for c in challenges if c.id in args.challenges]
 
@@ -566,13 +944,6 @@ def main() -> None:
     print(f"Total calls: {total_calls} | Workers: {workers}")
     print()
 
-    # Build list of all combos
-    combos: list[tuple[Challenge, str | None, int]] = []
-    for challenge in challenges:
-        for skill in skill_modes:
-            for run_idx in range(args.runs):
-                combos.append((challenge, skill, run_idx))
-
     # Initialize results structure
     all_results: dict[str, dict[str, list[EvalResult]]] = {}
     for challenge in challenges:
@@ -580,65 +951,196 @@ def main() -> None:
         for skill in skill_modes:
             all_results[challenge.id][label(skill)] = []
 
-    def _run_combo(combo: tuple[Challenge, str | None, int]) -> tuple[str, str, int, EvalResult | None, str]:
+    # Resume from the partial file of an interrupted --save run
+    partial_path = Path(args.save).with_suffix(".partial.jsonl") if args.save else None
+    done: set[tuple[str, str, int]] = set()
+    out_of_scope = 0  # checkpointed combos this run's filters exclude
+    if partial_path:
+        for cid, key, run_idx, result in load_partial_results(partial_path):
+            if key in all_results.get(cid, {}) and run_idx < args.runs:
+                if (cid, key, run_idx) not in done:
+                    done.add((cid, key, run_idx))
+                    all_results[cid][key].append(result)
+            else:
+                out_of_scope += 1
+        if done:
+            print(f"Resuming: {len(done)} combos loaded from {partial_path}")
+        if out_of_scope:
+            print(f"Ignoring {out_of_scope} checkpointed combos outside this run's "
+                  f"--challenges/--skill/--runs; they stay in {partial_path}")
+        if done or out_of_scope:
+            print()
+
+    # Build list of all combos
+    combos: list[tuple[Challenge, str | None, int]] = []
+    for challenge in challenges:
+        for skill in skill_modes:
+            for run_idx in range(args.runs):
+                if (challenge.id, label(skill), run_idx) not in done:
+                    combos.append((challenge, skill, run_idx))
+
+    async def _run_combo(
+        combo: tuple[Challenge, str | None, int],
+        slots: tuple[asyncio.Semaphore, asyncio.Semaphore] | None = None,
+    ) -> tuple[str, str, int, EvalResult | None, str]:
         """Run a single combo; returns (cid, key, run_idx, result_or_None, status_msg)."""
         challenge, skill, run_idx = combo
         key = label(skill)
+        subject_slots, judge_slots = slots or (None, None)
         try:
-            result = run_one(challenge, skill)
+            result = await run_one(
+                challenge, skill, cache=cache, verdicts=verdicts, run_idx=run_idx,
+                subject_slots=subject_slots, judge_slots=judge_slots,
+            )
             status = "PASS" if result.passed else "FAIL"
             return (challenge.id, key, run_idx, result, f"score={result.total_score} {status}")
         except Exception as e:
             return (challenge.id, key, run_idx, None, f"ERROR: {e}")
 
-    start = time.time()
-    completed = 0
-
-    if workers == 1:
-        # Sequential mode — preserve ordered output
+    partial_fp = None
+    if partial_path:
+        partial_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_fp = open(partial_path, "ab")
+    unsynced = 0
+
+    def _record(cid: str, key: str, run_idx: int, result: EvalResult | None) -> None:
+        """Keep a finished combo and checkpoint it to the partial file."""
+        nonlocal unsynced
+        if not result:
+            return
+        all_results[cid][key].append(result)
+        if partial_fp:
+            partial_fp.write(_partial_record(cid, key, run_idx, result))
+            partial_fp.flush()
+            unsynced += 1
+            if unsynced >= _PARTIAL_FSYNC_EVERY:
+                os.fsync(partial_fp.fileno())
+                unsynced = 0
+
+    def _converged(cid: str, key: str) -> bool:
+        """Whether a challenge/skill combo is stable enough to skip its remaining runs."""
+        if args.var_threshold is None:
+            return False
+        scores = [r.total_score for r in all_results[cid][key]]
+        return len(scores) >= args.min_runs and _variance(scores) < args.var_threshold
+
+    skipped = 0
+
+    async def _run_all() -> None:
+        nonlocal skipped
+        completed = len(done)
+
+        if workers == 1:
+            # Sequential mode — preserve ordered output
+            for combo in combos:
+                challenge, skill, run_idx = combo
+                if _converged(challenge.id, label(skill)):
+                    skipped += 1
+                    continue
+                completed += 1
+                tag = f"[{completed}/{total_combos}]"
+                print(f"  {tag} {challenge.id} + {label(skill)} (run {run_idx + 1})...", end=" ", flush=True)
+                cid, key, _, result, msg = await _run_combo(combo)
+                _record(cid, key, run_idx, result)
+                print(msg)
+            return
+
+        # Parallel mode — 2N workers pull from a queue of per-combo run deques, with
+        # up to N subject calls plus N judge phases in flight so judging overlaps
+        # the next subjects. Finished runs come back through one queue drained here.
+        slots = (asyncio.Semaphore(workers), asyncio.Semaphore(workers))
+        runs_by_combo: defaultdict[tuple[str, str], deque[tuple[Challenge, str | None, int]]] = (
+            defaultdict(deque)
+        )
         for combo in combos:
+            runs_by_combo[combo[0].id, label(combo[1])].append(combo)
+        pending: asyncio.Queue[deque[tuple[Challenge, str | None, int]]] = asyncio.Queue()
+        for runs in runs_by_combo.values():
+            pending.put_nowait(runs)
+        finished: asyncio.Queue[tuple[str, str, int, EvalResult | None, str] | None] = (
+            asyncio.Queue()
+        )
+        early_stop = args.var_threshold is not None
+
+        async def _worker() -> None:
+            while not pending.empty():
+                runs = pending.get_nowait()
+                challenge, skill, _ = runs[0]
+                if _converged(challenge.id, label(skill)):
+                    for _ in runs:
+                        finished.put_nowait(None)
+                    continue
+                combo = runs.popleft()
+                # With early stop, a combo's next run waits for this one's score
+                if runs and not early_stop:
+                    pending.put_nowait(runs)
+                item = await _run_combo(combo, slots)
+                _record(*item[:4])  # before requeueing, so _converged sees this run
+                finished.put_nowait(item)
+                if runs and early_stop:
+                    pending.put_nowait(runs)
+
+        tasks = [asyncio.create_task(_worker()) for _ in range(min(2 * workers, len(combos)))]
+        for _ in range(len(combos)):
+            item = await finished.get()
+            if item is None:
+                skipped += 1
+                continue
             completed += 1
-            challenge, skill, run_idx = combo
+            cid, key, run_idx, _, msg = item
             tag = f"[{completed}/{total_combos}]"
-            print(f"  {tag} {challenge.id} + {label(skill)} (run {run_idx + 1})...", end=" ", flush=True)
-            cid, key, _, result, msg = _run_combo(combo)
-            if result:
-                all_results[cid][key].append(result)
-            print(msg)
-    else:
-        # Parallel mode
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {executor.submit(_run_combo, c): c for c in combos}
-            for future in as_completed(futures):
-                completed += 1
-                cid, key, run_idx, result, msg = future.result()
-                if result:
-                    all_results[cid][key].append(result)
-                tag = f"[{completed}/{total_combos}]"
-                print(f"  {tag} {cid} + {key} (run {run_idx + 1})... {msg}")
+            print(f"  {tag} {cid} + {key} (run {run_idx + 1})... {msg}")
+        await asyncio.gather(*tasks)
 
-    elapsed = time.time() - start
+    start = time.monotonic()
+    try:
+        asyncio.run(_run_all())
+    finally:
+        if partial_fp:
+            partial_fp.close()
+
+    elapsed = time.monotonic() - start
     print(f"\nCompleted in {elapsed:.0f}s ({elapsed / 60:.1f}min)")
+    if skipped:
+        print(f"Early stop: skipped {skipped} runs (variance < {args.var_threshold})")
 
     # Build JSON data
-    json_data = results_to_json(challenges, all_results, skill_modes)
+    agg = _aggregate(challenges, all_results, skill_modes)
+    json_data = results_to_json(challenges, agg, skill_modes)
 
     # Save if requested
     if args.save:
         save_path = Path(args.save)
         save_path.parent.mkdir(parents=True, exist_ok=True)
-        save_path.write_text(json.dumps(json_data, indent=2), encoding="utf-8")
+        save_path.write_bytes(_dump_json(json_data))
         print(f"\nResults saved to {args.save}")
+        # Keep the checkpoint while combos are missing so a re-run retries only those
+        stored = sum(len(r) for modes in all_results.values() for r in modes.values())
+        if stored + skipped == total_combos:
+            # Only drop the checkpoint once nothing in it is still unused
+            if out_of_scope:
+                print(f"Keeping {partial_path}: it holds {out_of_scope} combos "
+                      "outside this run's scope")
+            else:
+                partial_path.unlink(missing_ok=True)
+        else:
+            print(f"Incomplete run; re-run with the same --save to resume from {partial_path}")
 
     # Output
     if args.json:
-        print(json.dumps(json_data, indent=2))
+        sys.stdout.flush()
+        sys.stdout.buffer.write(_dump_json(json_data) + b"\n")
     else:
-        print_element_grid(challenges, all_results, skill_modes)
-        print_summary_table(challenges, all_results, skill_modes)
+        print_element_grid(challenges, agg, skill_modes)
+        print_summary_table(challenges, agg, skill_modes)
 
         # Comparison if requested
         if args.compare:
+            # Only the JSON tallies are compared; release the per-run results
+            # (and their response text) before the saved file is loaded
+            all_results.clear()
+            if verdicts is not None:
+                verdicts.clear()
             saved = load_saved_results(Path(args.compare))
             print_comparison(json_data, saved)
 
@@ -11,18 +11,32 @@ Usage:
     python3 tools/setup.py update-all
     python3 tools/setup.py check
     python3 tools/setup.py version
+
+Set CLAUDE_FOUNDRY_HARDLINK=1 to hardlink deployed rules, agents, commands,
+skills and hooks instead of copying them (edits then affect the repo copy).
 """
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
+import io
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 
 def _ensure_utf8_stdio() -> None:
     """Reconfigure stdout/stderr to UTF-8 so print() emoji never crash on Windows.
@@ -230,6 +244,16 @@ HOOK_SCRIPTS = {
     "cargo-check.sh": {"langs": ["rust.md"], "desc": "Rust type checking (cargo check)"},
 }
 
+# PostToolUse matcher per hook script; scripts not listed match everything.
+_PY_EDIT = 'tool == "Edit" && tool_input.file_path matches "\\.py$"'
+_HOOK_MATCHERS = {
+    "ruff-format.sh": _PY_EDIT,
+    "mypy-check.sh": _PY_EDIT,
+    "prettier-format.sh": 'tool == "Edit" && tool_input.file_path matches "\\.(ts|tsx|js|jsx)$"',
+    "tsc-check.sh": 'tool == "Edit" && tool_input.file_path matches "\\.(ts|tsx)$"',
+    "cargo-check.sh": 'tool == "Edit" && tool_input.file_path matches "\\.rs$"',
+}
+
 AGENTS_DIR = REPO_ROOT / "agents"
 COMMANDS_DIR = REPO_ROOT / "commands"
 LEARNED_SKILLS_DIR = REPO_ROOT / "skills" / "learned"
@@ -328,15 +352,61 @@ MCP_SERVERS_FILE = REPO_ROOT / "mcp-configs" / "mcp-servers.json"
 # ── Helpers ─────────────────────────────────────────────────────────────
 
 
+def _json_loads(data: bytes):
+    """Parse JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize as 2-space indented JSON plus a trailing newline, as UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) + b"\n"
+    return (json.dumps(obj, indent=2) + "\n").encode("utf-8")
+
+
 def read_version() -> str:
-    """Read version from VERSION file (tarball) or git tag (clone)."""
-    version_file = REPO_ROOT / "VERSION"
+    """Read version from VERSION file (tarball) or git tag (clone).
+
+    Memoized per repo root; call ``_read_version.cache_clear()`` after the
+    checkout changes (e.g. a git pull) within the same process.
+    """
+    return _read_version(REPO_ROOT)
+
+
+def _read_cached(path: Path) -> bytes:
+    """Contents of a small file, reused until its mtime or size changes.
+
+    update-all reads each project's manifest and VERSION several times
+    (listing, partitioning, cmd_init); the stat keeps later writes visible.
+    """
+    st = os.stat(path)
+    return _read_bytes_at(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=128)
+def _read_bytes_at(path: Path, mtime_ns: int, size: int) -> bytes:
+    return path.read_bytes()
+
+
+def _read_project_version(project: Path) -> str | None:
+    """Version recorded in the project's .claude/VERSION, or None if absent."""
+    try:
+        return _read_cached(project / ".claude" / "VERSION").decode("utf-8").strip()
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _read_version(repo_root: Path) -> str:
+    version_file = repo_root / "VERSION"
     if version_file.exists():
         return version_file.read_text(encoding='utf-8').strip()
     # Fall back to latest git tag
     try:
         result = subprocess.run(
-            ["git", "-C", str(REPO_ROOT), "describe", "--tags", "--abbrev=0"],
+            ["git", "-C", str(repo_root), "describe", "--tags", "--abbrev=0"],
             capture_output=True, text=True, timeout=5,
         )
         if result.returncode == 0 and result.stdout.strip():
@@ -346,6 +416,11 @@ def read_version() -> str:
     return "dev"
 
 
+def _pick(items: Iterable, indices: set[int]) -> list:
+    """Items at the selected menu indices, in menu order."""
+    return [item for i, item in enumerate(items) if i in indices]
+
+
 def toggle_menu(title: str, items: list[str], selected: set[int],
                 required_one: bool = False) -> set[int]:
     """Interactive toggle menu. Returns set of selected indices.
@@ -395,22 +470,85 @@ def ask_int(msg: str, default: int) -> int:
         return default
 
 
+def _flush_writes(pending: list[tuple[Path, str | bytes]]) -> None:
+    """Write queued (path, data) pairs in order.
+
+    str data is written as UTF-8 text (platform newlines, as write_text
+    does); bytes (serialized JSON) are written verbatim.
+    """
+    for path, data in pending:
+        if isinstance(data, str):
+            path.write_text(data, encoding="utf-8")
+        else:
+            path.write_bytes(data)
+
+
 def save_manifest(project: Path, manifest: dict) -> None:
     """Save selection manifest for future re-init / update-all."""
     dest = project / ".claude" / "setup-manifest.json"
     dest.parent.mkdir(parents=True, exist_ok=True)
-    dest.write_text(json.dumps(manifest, indent=2) + "\n", encoding='utf-8')
+    dest.write_bytes(_json_dumps(manifest))
 
 
 def load_manifest(project: Path) -> dict | None:
     """Load saved selection manifest, or None if not present."""
     src = project / ".claude" / "setup-manifest.json"
-    if src.exists():
-        try:
-            return json.loads(src.read_text(encoding='utf-8'))
-        except (json.JSONDecodeError, OSError):
-            return None
-    return None
+    try:
+        # Parsed per call so callers always get a dict they can mutate
+        return _json_loads(_read_cached(src))
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+# Rule descriptions listed in the CLAUDE.md header
+_RULE_DESCRIPTIONS = {
+    # Language/tooling rules
+    "python.md": "Python tooling (uv, pytest, ruff)",
+    "rust.md": "Rust tooling (cargo, clippy)",
+    "go.md": "Go tooling (go mod, golangci-lint)",
+    "nodejs.md": "Node.js tooling (npm)",
+    "matlab.md": "MATLAB tooling",
+    # Project templates
+    "embedded-c.md": "Embedded C/C++ (MISRA, memory safety, build)",
+    "embedded-dsp.md": "Embedded DSP & Audio (real-time, numerical, HW)",
+    "react-app.md": "React application (components, state, UX)",
+    "rest-api.md": "REST API backend (layers, reliability, observability)",
+    "desktop-gui-qt.md": "Desktop GUI Qt (threading, signals, persistence)",
+    "library.md": "Library development (API design, versioning)",
+    "scripts.md": "Scripts & CLI (argument parsing, error handling)",
+    "data-pipeline.md": "Data pipeline (idempotency, validation, monitoring)",
+    "monolith.md": "Monolith architecture (module boundaries, migrations)",
+    # Platform rules
+    "github.md": "GitHub workflow (gh CLI, PR conventions)",
+    # Security rules
+    "enterprise.md": "Enterprise security (production, compliance)",
+    "internal.md": "Internal security (team tools)",
+    "sandbox.md": "Sandbox security (prototyping)",
+    # Base rules
+    "coding-style.md": "Code style guidelines",
+    "git-workflow.md": "Git workflow and commit conventions",
+    "security.md": "Security checks and practices",
+    "testing.md": "Testing requirements (TDD, 80% coverage)",
+    "architecture.md": "Architecture principles",
+    "performance.md": "Performance and model selection",
+    "agents.md": "Agent orchestration",
+    "codemaps.md": "Codemap system",
+    "hooks.md": "Hooks system",
+}
+
+# Every modular rule name (lang/template/platform/security) — listed before base rules
+_MODULAR_RULE_NAMES = frozenset(r for rules in MODULAR_RULES.values() for r in rules)
+
+
+def _rule_fallback_label(rule: str) -> str:
+    return rule.replace(".md", "").replace("-", " ").title()
+
+
+# Header description for every registry rule, including undescribed ones
+_RULE_LABELS = {
+    rule: _RULE_DESCRIPTIONS.get(rule) or _rule_fallback_label(rule)
+    for rule in (*BASE_RULES, *_MODULAR_RULE_NAMES)
+}
 
 
 def generate_claude_foundry_header(
@@ -418,56 +556,27 @@ def generate_claude_foundry_header(
     selected_langs: set[str],
 ) -> str:
     """Generate the claude-foundry header for CLAUDE.md."""
-    # Build rules list
-    rule_descriptions = {
-        # Language/tooling rules
-        "python.md": "Python tooling (uv, pytest, ruff)",
-        "rust.md": "Rust tooling (cargo, clippy)",
-        "go.md": "Go tooling (go mod, golangci-lint)",
-        "nodejs.md": "Node.js tooling (npm)",
-        "matlab.md": "MATLAB tooling",
-        # Project templates
-        "embedded-c.md": "Embedded C/C++ (MISRA, memory safety, build)",
-        "embedded-dsp.md": "Embedded DSP & Audio (real-time, numerical, HW)",
-        "react-app.md": "React application (components, state, UX)",
-        "rest-api.md": "REST API backend (layers, reliability, observability)",
-        "desktop-gui-qt.md": "Desktop GUI Qt (threading, signals, persistence)",
-        "library.md": "Library development (API design, versioning)",
-        "scripts.md": "Scripts & CLI (argument parsing, error handling)",
-        "data-pipeline.md": "Data pipeline (idempotency, validation, monitoring)",
-        "monolith.md": "Monolith architecture (module boundaries, migrations)",
-        # Platform rules
-        "github.md": "GitHub workflow (gh CLI, PR conventions)",
-        # Security rules
-        "enterprise.md": "Enterprise security (production, compliance)",
-        "internal.md": "Internal security (team tools)",
-        "sandbox.md": "Sandbox security (prototyping)",
-        # Base rules
-        "coding-style.md": "Code style guidelines",
-        "git-workflow.md": "Git workflow and commit conventions",
-        "security.md": "Security checks and practices",
-        "testing.md": "Testing requirements (TDD, 80% coverage)",
-        "architecture.md": "Architecture principles",
-        "performance.md": "Performance and model selection",
-        "agents.md": "Agent orchestration",
-        "codemaps.md": "Codemap system",
-        "hooks.md": "Hooks system",
-    }
+    # Output depends only on the rule multiset and the language set, so
+    # projects sharing a selection (common in update-all) share one render
+    return _claude_foundry_header(tuple(sorted(deployed_rules)), frozenset(selected_langs))
 
-    # Sort rules: lang/template/platform first, then base rules alphabetically
-    lang_rules = set(MODULAR_RULES.get("lang", {}).keys())
-    template_rules = set(MODULAR_RULES.get("templates", {}).keys())
-    platform_rules = set(MODULAR_RULES.get("platform", {}).keys())
-    security_rules = set(MODULAR_RULES.get("security", {}).keys())
-    modular_rules = lang_rules | template_rules | platform_rules | security_rules
 
-    modular_first = sorted(r for r in deployed_rules if r in modular_rules)
-    other_rules = sorted(r for r in deployed_rules if r not in modular_rules)
-    ordered_rules = modular_first + other_rules
+@functools.lru_cache(maxsize=32)
+def _claude_foundry_header(
+    deployed_rules: tuple[str, ...],
+    selected_langs: frozenset[str],
+) -> str:
+    # Sort rules: lang/template/platform first, then base rules alphabetically
+    modular_first: list[str] = []
+    other_rules: list[str] = []
+    for r in deployed_rules:
+        (modular_first if r in _MODULAR_RULE_NAMES else other_rules).append(r)
+    modular_first.sort()
+    other_rules.sort()
 
     rules_lines = []
-    for rule in ordered_rules:
-        desc = rule_descriptions.get(rule, rule.replace(".md", "").replace("-", " ").title())
+    for rule in modular_first + other_rules:
+        desc = _RULE_LABELS.get(rule) or _rule_fallback_label(rule)
         rules_lines.append(f"- `{rule}` — {desc}")
     rules_list = "\n".join(rules_lines) if rules_lines else "- (none deployed)"
 
@@ -514,6 +623,7 @@ def prepend_claude_foundry_header(content: str, header: str) -> str:
     return header + "\n" + content
 
 
+@functools.lru_cache(maxsize=None)
 def resolve_project_path(encoded_name: str) -> Path | None:
     """Resolve ~/.claude/projects/ encoded dir name to actual filesystem path.
 
@@ -524,35 +634,50 @@ def resolve_project_path(encoded_name: str) -> Path | None:
     if len(parts) < 2:
         return None
     base = Path("/") / parts[0] / parts[1]  # /home/rudm
-    remaining = parts[2:]
-
-    def _find(base: Path, remaining: list[str]) -> Path | None:
-        if not remaining:
-            return base if base.is_dir() else None
-        for take in range(1, len(remaining) + 1):
-            # Try underscore join
-            candidate = base / "_".join(remaining[:take])
-            if candidate.is_dir():
-                result = _find(candidate, remaining[take:])
-                if result:
-                    return result
-            # Try hyphen join (for dirs with actual hyphens)
-            if take > 1:
-                candidate = base / "-".join(remaining[:take])
-                if candidate.is_dir():
-                    result = _find(candidate, remaining[take:])
-                    if result:
-                        return result
-            # Try single part as-is (no join needed for take==1, already covered by underscore)
-            if take == 1:
-                candidate = base / remaining[0]
-                if candidate.is_dir():
-                    result = _find(candidate, remaining[1:])
-                    if result:
-                        return result
+    if not base.is_dir():
         return None
 
-    return _find(base, remaining)
+    subdirs: dict[str, frozenset[str]] = {}
+
+    def _subdirs(path: str) -> frozenset[str]:
+        """Subdirectory names of path; each directory is listed once."""
+        names = subdirs.get(path)
+        if names is None:
+            try:
+                with os.scandir(path) as it:
+                    names = frozenset(e.name for e in it if e.is_dir())
+            except OSError:
+                names = frozenset()
+            subdirs[path] = names
+        return names
+
+    # Depth-first over (directory, index of the next unconsumed part). Each
+    # directory's candidates are pushed in reverse so the first match follows
+    # the preference order: shortest join first, underscores before hyphens.
+    # A state seen before has already failed, so it is not expanded again.
+    stack = [(str(base), 2)]
+    seen: set[tuple[str, int]] = set()
+    while stack:
+        state = stack.pop()
+        if state in seen:
+            continue
+        seen.add(state)
+        path, idx = state
+        if idx == len(parts):
+            return Path(path)
+        names = _subdirs(path)
+        candidates = []
+        for end in range(idx + 1, len(parts) + 1):
+            joins = ["_".join(parts[idx:end])]
+            if end - idx > 1:
+                joins.append("-".join(parts[idx:end]))
+            for name in joins:
+                if not name:  # empty part: base / "" is the directory itself
+                    candidates.append((path, end))
+                elif name in names:
+                    candidates.append((os.path.join(path, name), end))
+        stack.extend(reversed(candidates))
+    return None
 
 
 def discover_projects() -> list[tuple[Path, bool]]:
@@ -563,40 +688,92 @@ def discover_projects() -> list[tuple[Path, bool]]:
     projects_dir = Path.home() / ".claude" / "projects"
     if not projects_dir.is_dir():
         return []
+    # encoded name -> resolved path from earlier runs; entries are trusted
+    # while the path still exists, so only new or moved projects are searched
+    cache_file = projects_dir.parent / "projects-resolve-cache.json"
+    try:
+        cache = _json_loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        cache = {}
+    if not isinstance(cache, dict):
+        cache = {}
+    fresh: dict[str, str] = {}
     results = []
     for d in sorted(projects_dir.iterdir()):
         if not d.is_dir():
             continue
-        resolved = resolve_project_path(d.name)
+        cached = cache.get(d.name)
+        if isinstance(cached, str) and Path(cached).is_dir():
+            resolved = Path(cached)
+        else:
+            resolved = resolve_project_path(d.name)
         if resolved and resolved.is_dir():
+            fresh[d.name] = str(resolved)
             has_setup = (resolved / ".claude" / "VERSION").exists()
             results.append((resolved, has_setup))
+    if fresh != cache:
+        try:
+            cache_file.write_bytes(_json_dumps(fresh))
+        except OSError:
+            pass
     return results
 
 
 # ── Detection ───────────────────────────────────────────────────────────
 
 
+# Every extension some detection rule looks for; once all are seen, scanning stops
+WANTED_EXTS = frozenset(
+    ext for rules in MODULAR_RULES.values() for meta in rules.values()
+    for ext in meta.get("detect", [])
+)
+
+
 def scan_extensions(project: Path) -> set[str]:
-    """Scan top 3 levels for file extensions."""
+    """Scan top 3 levels for file extensions.
+
+    Returns early once every extension in WANTED_EXTS has been found, so the
+    result is only complete for extensions that detection rules care about.
+    """
     exts: set[str] = set()
-    base_depth = len(project.parts)
-    for dirpath, dirnames, filenames in os.walk(project):
-        depth = len(Path(dirpath).parts) - base_depth
-        if depth >= 3:
-            dirnames.clear()
+    missing = set(WANTED_EXTS)
+    stack = [(os.fspath(project), 0)]
+    while stack:
+        dirpath, depth = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    name = entry.name
+                    try:
+                        is_dir = entry.is_dir()  # d_type from the dirent; stats symlinks only
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if (depth < 2 and not name.startswith(".") and name != "node_modules"
+                                and not entry.is_symlink()):
+                            stack.append((entry.path, depth + 1))
+                        continue
+                    # Same rule as Path.suffix: no leading-dot names, no trailing dot
+                    dot = name.rfind(".")
+                    if 0 < dot < len(name) - 1:
+                        ext = name[dot:]
+                        exts.add(ext)
+                        if ext in missing:
+                            missing.discard(ext)
+                            if not missing:
+                                return exts
+        except OSError:
             continue
-        dirnames[:] = [d for d in dirnames if not d.startswith(".") and d != "node_modules"]
-        for f in filenames:
-            ext = Path(f).suffix
-            if ext:
-                exts.add(ext)
     return exts
 
 
-def detect_languages(project: Path) -> set[str]:
-    """Return set of detected lang rule names."""
-    exts = scan_extensions(project)
+def detect_languages(project: Path, exts: set[str] | None = None) -> set[str]:
+    """Return set of detected lang rule names.
+
+    ``exts`` is a precomputed scan_extensions() result; scanned if omitted.
+    """
+    if exts is None:
+        exts = scan_extensions(project)
     detected: set[str] = set()
 
     for rule, meta in MODULAR_RULES["lang"].items():
@@ -614,14 +791,21 @@ def detect_languages(project: Path) -> set[str]:
     return detected
 
 
+DEP_FILES = ("package.json", "pyproject.toml", "requirements.txt")
+
+
 def _read_dep_files(project: Path) -> str:
     """Read dependency files for keyword scanning."""
+    try:
+        with os.scandir(project) as it:
+            present = {e.name for e in it if e.name in DEP_FILES and e.is_file()}
+    except OSError:
+        return ""
     text = ""
-    for name in ["package.json", "pyproject.toml", "requirements.txt"]:
-        p = project / name
-        if p.exists():
+    for name in DEP_FILES:
+        if name in present:
             try:
-                text += p.read_text(encoding='utf-8', errors="ignore")
+                text += (project / name).read_text(encoding='utf-8', errors="ignore")
             except OSError:
                 pass
     return text
@@ -645,9 +829,16 @@ def detect_platform(project: Path) -> set[str]:
     return detected
 
 
-def detect_templates(project: Path) -> set[str]:
-    """Return set of detected template rule names."""
-    exts = scan_extensions(project)
+def detect_templates(
+    project: Path, exts: set[str] | None = None, dep_text: str | None = None,
+) -> set[str]:
+    """Return set of detected template rule names.
+
+    ``exts`` and ``dep_text`` are precomputed scan_extensions() and
+    _read_dep_files() results; read from the project if omitted.
+    """
+    if exts is None:
+        exts = scan_extensions(project)
     detected: set[str] = set()
 
     for rule, meta in MODULAR_RULES["templates"].items():
@@ -661,7 +852,8 @@ def detect_templates(project: Path) -> set[str]:
                 detected.add(rule)
 
     # Dependency keyword detection
-    dep_text = _read_dep_files(project)
+    if dep_text is None:
+        dep_text = _read_dep_files(project)
     for rule, meta in MODULAR_RULES["templates"].items():
         for kw in meta.get("dep_keywords", []):
             if kw.lower() in dep_text.lower():
@@ -670,6 +862,30 @@ def detect_templates(project: Path) -> set[str]:
     return detected
 
 
+# Paths whose mtimes, together with the project dir's own, fingerprint the
+# inputs of detection: config/dependency files, .github and the git remotes.
+_DETECTION_INPUTS = (
+    ".", ".github", ".git/config", *DEP_FILES,
+    *sorted({cfg for rules in MODULAR_RULES.values() for meta in rules.values()
+             for cfg in meta.get("config", [])} - set(DEP_FILES)),
+)
+
+
+def _detection_fingerprint(project: Path) -> str:
+    """Hash the mtimes of detection inputs, to validate a cached detection result.
+
+    Files added below the top level do not change it; re-run ``init``
+    interactively to force a fresh scan.
+    """
+    stamps: dict[str, int] = {}
+    for name in _DETECTION_INPUTS:
+        try:
+            stamps[name] = (project / name).stat().st_mtime_ns
+        except OSError:
+            pass
+    return hashlib.blake2b(json.dumps(stamps).encode("utf-8"), digest_size=16).hexdigest()
+
+
 def migrate_manifest(manifest: dict) -> dict:
     """Migrate a manifest from old category structure to new template structure."""
     modular = manifest.get("modular_rules", {})
@@ -900,20 +1116,8 @@ def generate_settings_json(
     post_hooks = []
     for script in hooks:
         meta = HOOK_SCRIPTS[script]
-        # Determine matcher from script name
-        if "ruff" in script or "mypy" in script:
-            matcher = 'tool == "Edit" && tool_input.file_path matches "\\.py$"'
-        elif "prettier" in script:
-            matcher = 'tool == "Edit" && tool_input.file_path matches "\\.(ts|tsx|js|jsx)$"'
-        elif "tsc" in script:
-            matcher = 'tool == "Edit" && tool_input.file_path matches "\\.(ts|tsx)$"'
-        elif "cargo" in script:
-            matcher = 'tool == "Edit" && tool_input.file_path matches "\\.rs$"'
-        else:
-            matcher = ""
-
         post_hooks.append({
-            "matcher": matcher,
+            "matcher": _HOOK_MATCHERS.get(script, ""),
             "hooks": [{"type": "command", "command": f".claude/hooks/library/{script}"}],
             "description": meta["desc"],
         })
@@ -951,6 +1155,71 @@ def generate_claude_md(
 """
 
 
+# Per-run tally of _link_or_copy outcomes, reset and reported by cmd_init.
+_deploy_stats = {"copied": 0, "unchanged": 0}
+
+
+def _link_or_copy(src: str | Path, dst: str | Path) -> str | Path:
+    """Deploy one file: a hardlink when CLAUDE_FOUNDRY_HARDLINK=1, else copy2.
+
+    Hardlinks make deployment nearly free when .claude/ sits on the same
+    filesystem as the repo, but the deployed file then shares the repo's
+    inode, so editing it in .claude/ edits the repo copy too. That is why
+    linking is opt-in. It falls back to copying across filesystems.
+
+    An existing dst is left alone when it is already up to date: the same
+    inode when linking, or a separate file with the source's size and mtime
+    (copy2 preserves mtime) when copying.
+    """
+    linking = os.environ.get("CLAUDE_FOUNDRY_HARDLINK") == "1"
+    try:
+        s, d = os.stat(src), os.stat(dst)
+    except FileNotFoundError:
+        pass
+    else:
+        same_inode = s.st_ino == d.st_ino and s.st_dev == d.st_dev
+        if same_inode if linking else (
+                not same_inode and s.st_size == d.st_size
+                and s.st_mtime_ns == d.st_mtime_ns):
+            _deploy_stats["unchanged"] += 1
+            return dst
+    _deploy_stats["copied"] += 1
+    if linking:
+        try:
+            if os.path.lexists(dst):
+                os.unlink(dst)
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass
+    try:
+        return shutil.copy2(src, dst)
+    except shutil.SameFileError:
+        # dst is still a hardlink from an earlier linked deploy: detach it
+        os.unlink(dst)
+        return shutil.copy2(src, dst)
+
+
+def _sync_tree(src: str | Path, dest: str | Path) -> None:
+    """Mirror directory src into dest, removing extras and skipping unchanged files."""
+    os.makedirs(dest, exist_ok=True)
+    with os.scandir(src) as it:
+        entries = {e.name: e.is_dir() for e in it}
+    with os.scandir(dest) as it:
+        for e in it:
+            is_dir = e.is_dir(follow_symlinks=False)
+            if entries.get(e.name) is not is_dir:
+                if is_dir:
+                    shutil.rmtree(e.path)
+                else:
+                    os.unlink(e.path)
+    for name, is_dir in entries.items():
+        if is_dir:
+            _sync_tree(os.path.join(src, name), os.path.join(dest, name))
+        else:
+            _link_or_copy(os.path.join(src, name), os.path.join(dest, name))
+
+
 def copy_rules(
     project: Path,
     base: list[str],
@@ -985,7 +1254,7 @@ def copy_rules(
     for rule in base:
         src = REPO_ROOT / "rules" / rule
         if src.exists():
-            shutil.copy2(src, rules_dir / rule)
+            _link_or_copy(src, rules_dir / rule)
             deployed.add(rule)
 
     # Modular rules (flatten into same dir; prefix with category only
@@ -997,19 +1266,28 @@ def copy_rules(
                 continue
             collision = rule in base and (rules_dir / rule).exists()
             dest_name = f"{category}-{rule}" if collision else rule
-            shutil.copy2(src, rules_dir / dest_name)
+            _link_or_copy(src, rules_dir / dest_name)
             deployed.add(dest_name)
 
     # Cleanup pass: remove any .md rule file that isn't in the current
     # deployment and isn't owned by a private source prefix.
-    for existing in rules_dir.iterdir():
-        if not existing.is_file() or existing.suffix != ".md":
-            continue
-        if existing.name in deployed:
-            continue
-        if any(existing.name.startswith(f"{p}-") for p in private_prefixes):
-            continue
-        existing.unlink()
+    with os.scandir(rules_dir) as it:
+        for entry in it:
+            name = entry.name
+            if not name.endswith(".md") or name in deployed or not entry.is_file():
+                continue
+            if any(name.startswith(f"{p}-") for p in private_prefixes):
+                continue
+            os.unlink(entry.path)
+
+
+@functools.lru_cache(maxsize=1)
+def _agent_files() -> tuple[str, ...]:
+    """Sorted agent file names in AGENTS_DIR, listed once per process."""
+    if not AGENTS_DIR.is_dir():
+        return ()
+    with os.scandir(AGENTS_DIR) as it:
+        return tuple(sorted(e.name for e in it if e.name.endswith(".md")))
 
 
 def copy_agents(
@@ -1020,17 +1298,17 @@ def copy_agents(
     private_prefixes = private_prefixes or []
     dest = project / ".claude" / "agents"
     dest.mkdir(parents=True, exist_ok=True)
+    with os.scandir(dest) as it:
+        existing = {e.name: e.path for e in it if e.name.endswith(".md")}
     # Remove stale agents not in current selection (skip private-prefixed files)
-    wanted = set(agents)
-    for existing in dest.iterdir():
-        if existing.suffix == ".md" and existing.name not in wanted:
-            if any(existing.name.startswith(f"{p}-") for p in private_prefixes):
-                continue
-            existing.unlink()
+    private = tuple(f"{p}-" for p in private_prefixes)
+    for name in existing.keys() - set(agents):
+        if not (private and name.startswith(private)):
+            os.unlink(existing[name])
+    available = set(_agent_files())
     for agent in agents:
-        src = AGENTS_DIR / agent
-        if src.exists():
-            shutil.copy2(src, dest / agent)
+        if agent in available:
+            _link_or_copy(AGENTS_DIR / agent, dest / agent)
 
 
 def _command_skill_parent(command_stem: str) -> str | None:
@@ -1067,34 +1345,41 @@ def copy_commands(
     dest = project / ".claude" / "commands"
     dest.mkdir(parents=True, exist_ok=True)
     # Determine which commands to copy
-    eligible = set()
-    for src in COMMANDS_DIR.iterdir():
-        if src.suffix != ".md":
-            continue
-        parent_skill = _command_skill_parent(src.stem)
-        # Skip skill-associated commands unless the parent skill is selected
-        if parent_skill and parent_skill not in selected_skills:
-            continue
-        eligible.add(src.name)
-    # Remove stale commands not in eligible set (skip private-prefixed files)
-    for existing in dest.iterdir():
-        if existing.suffix == ".md" and existing.name not in eligible:
-            if any(existing.name.startswith(f"{p}-") for p in private_prefixes):
+    eligible: dict[str, str] = {}  # name -> source path
+    with os.scandir(COMMANDS_DIR) as it:
+        for entry in it:
+            name = entry.name
+            if not name.endswith(".md"):
+                continue
+            parent_skill = _command_skill_parent(name[:-3])
+            # Skip skill-associated commands unless the parent skill is selected
+            if parent_skill and parent_skill not in selected_skills:
                 continue
-            existing.unlink()
-    # Copy eligible commands
-    for name in eligible:
-        shutil.copy2(COMMANDS_DIR / name, dest / name)
+            eligible[name] = entry.path
+    with os.scandir(dest) as it:
+        existing = {e.name: e.path for e in it if e.name.endswith(".md")}
+    # Remove stale commands not in eligible set (skip private-prefixed files)
+    private = tuple(f"{p}-" for p in private_prefixes)
+    for name in existing.keys() - eligible.keys():
+        if not (private and name.startswith(private)):
+            os.unlink(existing[name])
+    # Copy eligible commands (unchanged ones are skipped by _link_or_copy)
+    for name, src in eligible.items():
+        _link_or_copy(src, os.path.join(dest, name))
 
 
 def discover_learned_categories() -> list[str]:
     """Return sorted list of learned skill category directories."""
     if not LEARNED_SKILLS_DIR.is_dir():
         return []
-    return sorted(
-        d.name for d in LEARNED_SKILLS_DIR.iterdir()
-        if d.is_dir() and not d.name.startswith(".")
-    )
+    with os.scandir(LEARNED_SKILLS_DIR) as it:
+        return sorted(e.name for e in it if not e.name.startswith(".") and e.is_dir())
+
+
+@functools.lru_cache(maxsize=1)
+def _learned_categories() -> tuple[str, ...]:
+    """discover_learned_categories(), listed once per process (update-all reuses it)."""
+    return tuple(discover_learned_categories())
 
 
 def copy_learned_skills(project: Path, categories: list[str]) -> None:
@@ -1110,13 +1395,15 @@ def copy_learned_skills(project: Path, categories: list[str]) -> None:
             continue
         dest = dest_base / cat
         dest.mkdir(parents=True, exist_ok=True)
-        for skill_file in src.iterdir():
-            if skill_file.suffix == ".md":
-                # Warn on conflict with project-local skills
-                local_conflict = local_base / cat / skill_file.name
-                if local_conflict.exists():
-                    print(f"  ⚠ Conflict: {skill_file.name} exists in both learned/ and learned-local/{cat}/")
-                shutil.copy2(skill_file, dest / skill_file.name)
+        with os.scandir(src) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith(".md"):
+                    # Warn on conflict with project-local skills
+                    local_conflict = local_base / cat / name
+                    if local_conflict.exists():
+                        print(f"  ⚠ Conflict: {name} exists in both learned/ and learned-local/{cat}/")
+                    _link_or_copy(entry.path, dest / name)
 
 
 def copy_skills(
@@ -1131,42 +1418,45 @@ def copy_skills(
     # Remove stale foundry skills not in current selection.
     # Skip: learned/, learned-local/, and private-prefixed dirs.
     protected = {"learned", "learned-local", "_lib"}
-    for existing in skills_dir.iterdir():
-        if not existing.is_dir():
-            continue
-        if existing.name in protected:
-            continue
-        if any(existing.name.startswith(f"{p}-") for p in private_prefixes):
-            continue
-        if existing.name not in wanted:
-            shutil.rmtree(existing)
+    with os.scandir(skills_dir) as it:
+        stale = [
+            entry.path for entry in it
+            if entry.name not in wanted and entry.name not in protected
+            and not any(entry.name.startswith(f"{p}-") for p in private_prefixes)
+            and entry.is_dir()
+        ]
+    for path in stale:
+        shutil.rmtree(path)
     # Copy selected skills
     for skill in skills:
         src = REPO_ROOT / "skills" / skill
         dest = skills_dir / skill
         if src.is_dir():
-            if dest.exists():
-                shutil.rmtree(dest)
-            shutil.copytree(src, dest)
+            _sync_tree(src, dest)
     # Copy shared libraries (e.g., _lib/session-id.sh used by prj-* skills)
     lib_src = REPO_ROOT / "skills" / "_lib"
     if lib_src.is_dir():
-        lib_dest = skills_dir / "_lib"
-        if lib_dest.exists():
-            shutil.rmtree(lib_dest)
-        shutil.copytree(lib_src, lib_dest)
+        _sync_tree(lib_src, skills_dir / "_lib")
 
 
 def copy_hooks(project: Path, hooks: list[str]) -> None:
     if hooks:
         lib_dest = project / ".claude" / "hooks" / "library"
         lib_dest.mkdir(parents=True, exist_ok=True)
+        # One scandir pass gives both existence and source mode; copy2 keeps
+        # the mode, so the dest needs no re-stat before adding the x bits.
+        # A tree without hooks/library just has no sources, as with exists().
+        try:
+            with os.scandir(REPO_ROOT / "hooks" / "library") as it:
+                sources = {e.name: e for e in it if e.is_file()}
+        except FileNotFoundError:
+            sources = {}
         for script in hooks:
-            src = REPO_ROOT / "hooks" / "library" / script
-            if src.exists():
+            entry = sources.get(script)
+            if entry is not None:
                 dest = lib_dest / script
-                shutil.copy2(src, dest)
-                dest.chmod(dest.stat().st_mode | 0o111)
+                _link_or_copy(Path(entry.path), dest)
+                os.chmod(dest, entry.stat().st_mode | 0o111)
 
 
 def _substitute_placeholders(value):
@@ -1259,6 +1549,24 @@ def _maybe_install_copilot_extension(interactive: bool) -> None:
         print(f"    bash {script}")
 
 
+def _mcp_servers() -> dict | None:
+    """mcpServers mapping from MCP_SERVERS_FILE, or None if the file is missing.
+
+    Parsed once per file mtime, so update-all reuses it across projects;
+    callers must not mutate the returned dict.
+    """
+    try:
+        mtime_ns = MCP_SERVERS_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _load_mcp_servers(MCP_SERVERS_FILE, mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_mcp_servers(path: Path, mtime_ns: int) -> dict:
+    return _json_loads(path.read_bytes())["mcpServers"]
+
+
 def write_mcp_servers(project: Path, servers: list[str]) -> None:
     """Deep-merge selected MCP servers into <project>/.mcp.json.
 
@@ -1273,20 +1581,21 @@ def write_mcp_servers(project: Path, servers: list[str]) -> None:
     so users don't lose their selections on re-run, then strip the
     mcpServers key from .claude.json (leaving any unrelated fields alone).
     """
-    if not servers or not MCP_SERVERS_FILE.exists():
+    all_servers = _mcp_servers() if servers else None
+    if all_servers is None:
         return
-    all_servers = json.loads(MCP_SERVERS_FILE.read_text(encoding='utf-8'))["mcpServers"]
-    selected = {k: v for k, v in all_servers.items() if k in servers}
-    # Remove description fields (not valid in mcp.json) and substitute placeholders
-    for srv in selected.values():
-        srv.pop("description", None)
-    selected = _substitute_placeholders(selected)
+    # Drop description fields (not valid in mcp.json) and substitute
+    # placeholders, building fresh dicts so the cached registry stays intact
+    selected = _substitute_placeholders({
+        k: {f: x for f, x in v.items() if f != "description"}
+        for k, v in all_servers.items() if k in servers
+    })
 
     mcp_json = project / ".mcp.json"
     data: dict = {}
     if mcp_json.exists():
         try:
-            data = json.loads(mcp_json.read_text(encoding='utf-8'))
+            data = _json_loads(mcp_json.read_bytes())
         except json.JSONDecodeError:
             data = {}
 
@@ -1296,7 +1605,7 @@ def write_mcp_servers(project: Path, servers: list[str]) -> None:
     legacy_changed = False
     if legacy.exists():
         try:
-            legacy_data = json.loads(legacy.read_text(encoding='utf-8'))
+            legacy_data = _json_loads(legacy.read_bytes())
         except json.JSONDecodeError:
             legacy_data = {}
         if isinstance(legacy_data, dict) and "mcpServers" in legacy_data:
@@ -1305,14 +1614,13 @@ def write_mcp_servers(project: Path, servers: list[str]) -> None:
             legacy_changed = True
             if legacy_data:
                 # Other fields exist — rewrite the legacy file without mcpServers
-                legacy.write_text(json.dumps(legacy_data, indent=2) + "\n",
-                                  encoding='utf-8')
+                legacy.write_bytes(_json_dumps(legacy_data))
             else:
                 # Legacy file was only mcpServers — remove it entirely
                 legacy.unlink()
 
     data.setdefault("mcpServers", {}).update(selected)
-    mcp_json.write_text(json.dumps(data, indent=2) + "\n", encoding='utf-8')
+    mcp_json.write_bytes(_json_dumps(data))
 
     if legacy_changed:
         print(f"  Migrated MCP servers from .claude.json → .mcp.json")
@@ -1325,23 +1633,37 @@ def cmd_version() -> None:
     print(f"claude-foundry version: {read_version()}")
 
 
+@functools.lru_cache(maxsize=1)
+def _remote_tags(repo_root: Path) -> str:
+    """Raw ``git ls-remote --tags origin`` output, fetched once per process."""
+    result = subprocess.run(
+        ["git", "-C", str(repo_root), "ls-remote", "--tags", "origin"],
+        capture_output=True, text=True, timeout=10,
+    )
+    return result.stdout
+
+
+def _version_key(tag: str) -> tuple[int, ...]:
+    """Numeric sort key for a version tag, so v10.0.0 sorts after v9.0.0."""
+    return tuple(int(n) for n in re.findall(r"\d+", tag))
+
+
 def cmd_check() -> None:
     local = read_version()
     print(f"Local repo version: {local}")
     # Try fetching from GitHub
     try:
-        result = subprocess.run(
-            ["git", "-C", str(REPO_ROOT), "ls-remote", "--tags", "origin"],
-            capture_output=True, text=True, timeout=10,
+        latest = max(
+            (
+                line.rpartition("\t")[2].removeprefix("refs/tags/").strip()
+                for line in _remote_tags(REPO_ROOT).splitlines()
+                if "refs/tags/" in line and not line.endswith("^{}")
+            ),
+            key=_version_key,
+            default=None,
         )
-        tags = [
-            line.split("refs/tags/")[-1].strip()
-            for line in result.stdout.strip().splitlines()
-            if "refs/tags/" in line and "^{}" not in line
-        ]
-        if tags:
-            latest = sorted(tags)[-1]
-            if latest > local:
+        if latest:
+            if _version_key(latest) > _version_key(local):
                 print(f"Latest on GitHub: {latest} — update available")
                 print(f"  cd {REPO_ROOT} && git pull && python3 tools/setup.py init")
             else:
@@ -1375,9 +1697,8 @@ def cmd_init(
     print()
 
     # ── Pre-checks ──
-    version_file = project / ".claude" / "VERSION"
-    if version_file.exists() and interactive:
-        existing = version_file.read_text(encoding='utf-8').strip()
+    existing = _read_project_version(project) if interactive else None
+    if existing is not None:
         if existing == version:
             if not confirm("Already configured with current version. Reconfigure?", default=False):
                 return False
@@ -1398,15 +1719,30 @@ def cmd_init(
         """Compute pre-selected indices from manifest."""
         if not manifest:
             return set()
-        saved = manifest.get(manifest_key, []) if not manifest_sub else \
-            manifest.get(manifest_key, {}).get(manifest_sub, [])
+        saved = set(manifest.get(manifest_key, []) if not manifest_sub else
+                    manifest.get(manifest_key, {}).get(manifest_sub, []))
         return {i for i, item in enumerate(registry_items) if item in saved}
 
     # ── 1. Detect languages & templates ──
     print("Scanning project...")
-    detected_langs = detect_languages(project)
-    detected_templates = detect_templates(project)
-    detected_platform = detect_platform(project)
+    fingerprint = _detection_fingerprint(project)
+    detection_cache = manifest.get("detection_cache") if manifest else None
+    if (not interactive and isinstance(detection_cache, dict)
+            and detection_cache.get("fingerprint") == fingerprint):
+        # Unchanged inputs since the last run: reuse its result, skip walk and git
+        detected_langs = set(detection_cache.get("langs", []))
+        detected_templates = set(detection_cache.get("templates", []))
+        detected_platform = set(detection_cache.get("platform", []))
+    else:
+        # The tree walk, dependency-file reads and `git remote` all block on I/O
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            exts_future = pool.submit(scan_extensions, project)
+            dep_future = pool.submit(_read_dep_files, project)
+            platform_future = pool.submit(detect_platform, project)
+            exts = exts_future.result()
+            detected_langs = detect_languages(project, exts)
+            detected_templates = detect_templates(project, exts, dep_future.result())
+            detected_platform = platform_future.result()
 
     all_detected = detected_langs | detected_templates | detected_platform
     if all_detected:
@@ -1415,17 +1751,12 @@ def cmd_init(
         print("No languages or templates auto-detected.")
 
     # ── Pre-compute static data ──
-    learned_cats = discover_learned_categories()
-    agent_files = (sorted(f.name for f in AGENTS_DIR.iterdir() if f.suffix == ".md")
-                   if AGENTS_DIR.is_dir() else [])
+    learned_cats = list(_learned_categories())
+    agent_files = list(_agent_files())
     hook_names = list(HOOK_SCRIPTS.keys())
-    mcp_available = MCP_SERVERS_FILE.exists()
-    mcp_names: list[str] = []
-    mcp_descs: list[str] = []
-    if mcp_available:
-        all_mcp_data = json.loads(MCP_SERVERS_FILE.read_text(encoding='utf-8'))["mcpServers"]
-        mcp_names = list(all_mcp_data.keys())
-        mcp_descs = [f"{k} — {v.get('description', '')}" for k, v in all_mcp_data.items()]
+    all_mcp_data = _mcp_servers()
+    mcp_available = all_mcp_data is not None
+    mcp_names: list[str] = list(all_mcp_data) if all_mcp_data is not None else []
     existing_private = manifest.get("private_sources", []) if manifest else []
     existing_private_prefixes = [s["prefix"] for s in existing_private]
     category_labels = {"lang": "Languages", "templates": "Project Template",
@@ -1628,42 +1959,44 @@ def cmd_init(
 
                 elif name == "plugins":
                     sfd = _for_detection()
-                    lsp_plugins: list[tuple[str, str]] = []
-                    seen_lsp: set[str] = set()
+                    # name -> description; dict insertion order is menu order
+                    # and doubles as the dedupe for LSP plugins shared by langs
+                    all_plugins: dict[str, str] = {}
                     for lang in sfd:
                         if lang in LSP_PLUGINS:
                             plugin, binary = LSP_PLUGINS[lang]
-                            if plugin not in seen_lsp:
-                                lsp_plugins.append((plugin, binary))
-                                seen_lsp.add(plugin)
-                    all_plugins = ([(p, f"LSP: {b}") for p, b in lsp_plugins] +
-                                   [(p, d) for p, d in WORKFLOW_PLUGINS])
-                    plugin_display = [f"{p} — {d}" for p, d in all_plugins]
+                            all_plugins.setdefault(plugin, f"LSP: {binary}")
+                    all_plugins.update(WORKFLOW_PLUGINS)
+                    plugin_names = list(all_plugins)
+                    plugin_index = {p: i for i, p in enumerate(plugin_names)}
                     if saved_plugin_names is not None:
-                        auto = {i for i, (p, _) in enumerate(all_plugins)
-                                if p in saved_plugin_names}
+                        auto = {plugin_index[p] for p in saved_plugin_names
+                                if p in plugin_index}
                     elif manifest:
-                        sp = manifest.get("plugins", [])
-                        auto = {i for i, (p, _) in enumerate(all_plugins) if p in sp}
+                        auto = {plugin_index[p] for p in manifest.get("plugins", [])
+                                if p in plugin_index}
                     else:
-                        auto = set(range(len(all_plugins)))
+                        auto = set(range(len(plugin_names)))
                     if interactive:
+                        plugin_display = [f"{p} — {d}" for p, d in all_plugins.items()]
                         result = toggle_menu("Plugins", plugin_display, auto)
                     else:
                         result = auto
                     saved_steps["plugins"] = result
-                    saved_plugin_names = {all_plugins[i][0] for i in result
-                                          if i < len(all_plugins)}
+                    saved_plugin_names = {plugin_names[i] for i in result
+                                          if i < len(plugin_names)}
 
                 elif name == "mcp":
                     if "mcp" in saved_steps:
                         auto = saved_steps["mcp"]
                     elif manifest:
-                        sm = manifest.get("mcp_servers", [])
+                        sm = set(manifest.get("mcp_servers", []))
                         auto = {i for i, n in enumerate(mcp_names) if n in sm}
                     else:
                         auto = set()
                     if interactive:
+                        mcp_descs = [f"{k} — {v.get('description', '')}"
+                                     for k, v in all_mcp_data.items()]
                         saved_steps["mcp"] = toggle_menu(
                             "MCP Servers (optional)", mcp_descs, auto)
                     else:
@@ -1673,8 +2006,6 @@ def cmd_init(
                     # Opt-in tooling (default OFF). Each feature excludes a
                     # chunk of tools/ from the foundry self-copy unless the
                     # user deliberately checks it here.
-                    feat_labels = [f"{label} — {desc}"
-                                   for _, label, desc in OPTIONAL_FEATURES]
                     if "features" in saved_steps:
                         auto = saved_steps["features"]
                     elif manifest:
@@ -1684,6 +2015,8 @@ def cmd_init(
                     else:
                         auto = set()
                     if interactive:
+                        feat_labels = [f"{label} — {desc}"
+                                       for _, label, desc in OPTIONAL_FEATURES]
                         saved_steps["features"] = toggle_menu(
                             "Optional Features", feat_labels, auto)
                     else:
@@ -1788,26 +2121,24 @@ def cmd_init(
         return False
 
     # ── Derive final selections ──
-    selected_base = [BASE_RULES[i] for i in sorted(saved_steps.get("base", set()))]
+    selected_base = _pick(BASE_RULES, saved_steps.get("base", set()))
     selected_modular: dict[str, list[str]] = {}
     for cat in modular_categories:
-        rules = list(MODULAR_RULES[cat].keys())
-        chosen = [rules[i] for i in sorted(saved_steps.get(cat, set()))]
+        chosen = _pick(MODULAR_RULES[cat], saved_steps.get(cat, set()))
         if chosen:
             selected_modular[cat] = chosen
     selected_langs = set(selected_modular.get("lang", []))
     selected_templates = set(selected_modular.get("templates", []))
     selected_for_detection = selected_langs | selected_templates
-    selected_hooks = [hook_names[i] for i in sorted(saved_steps.get("hooks", set()))]
-    selected_agents = [agent_files[i] for i in sorted(saved_steps.get("agents", set()))]
-    selected_skills = [SKILLS[i] for i in sorted(saved_steps.get("skills", set()))]
-    selected_learned = ([learned_cats[i] for i in sorted(saved_steps.get("learned", set()))]
-                        if learned_cats else [])
+    selected_hooks = _pick(hook_names, saved_steps.get("hooks", set()))
+    selected_agents = _pick(agent_files, saved_steps.get("agents", set()))
+    selected_skills = _pick(SKILLS, saved_steps.get("skills", set()))
+    selected_learned = _pick(learned_cats, saved_steps.get("learned", set()))
     selected_plugins = sorted(saved_plugin_names) if saved_plugin_names else []
-    mcp_servers = ([mcp_names[i] for i in sorted(saved_steps.get("mcp", set()))]
+    mcp_servers = (_pick(mcp_names, saved_steps.get("mcp", set()))
                    if mcp_available else [])
-    selected_features = [OPTIONAL_FEATURES[i][0]
-                         for i in sorted(saved_steps.get("features", set()))]
+    selected_features = [name for name, _, _ in
+                         _pick(OPTIONAL_FEATURES, saved_steps.get("features", set()))]
 
     # Copilot-* skills are gated on the copilot-mcp MCP server being selected.
     # Selecting the MCP pulls in the skills; deselecting drops them.
@@ -1830,11 +2161,16 @@ def cmd_init(
                 selected_skills.append(skill)
 
     # ── Pre-check CLAUDE.md for non-interactive mode ──
+    # Read once; the write step below reuses the content and marker check
     claude_md = project / "CLAUDE.md"
+    try:
+        existing_content: str | None = claude_md.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        existing_content = None
+    has_header = existing_content is not None and has_claude_foundry_header(existing_content)
     force_merge = False
-    if not interactive and claude_md.exists():
-        existing_content = claude_md.read_text(encoding='utf-8')
-        if not has_claude_foundry_header(existing_content):
+    if not interactive and existing_content is not None:
+        if not has_header:
             if force:
                 # Force flag — ask for confirmation before proceeding
                 print(f"\n  WARNING: CLAUDE.md exists without claude-foundry marker.")
@@ -1861,10 +2197,15 @@ def cmd_init(
     claude_dir = project / ".claude"
     claude_dir.mkdir(parents=True, exist_ok=True)
 
+    # Small generated files are queued here and written together once the
+    # CLAUDE.md decision is made (see _flush_writes)
+    pending: list[tuple[Path, str | bytes]] = []
+
     # VERSION
-    (claude_dir / "VERSION").write_text(version + "\n", encoding='utf-8')
+    pending.append((claude_dir / "VERSION", f"{version}\n"))
 
     # Rules
+    _deploy_stats.update(copied=0, unchanged=0)
     copy_rules(project, selected_base, selected_modular, private_prefixes)
 
     # Agents
@@ -1887,7 +2228,7 @@ def cmd_init(
 
     # settings.json
     settings = generate_settings_json(selected_hooks, selected_plugins)
-    (claude_dir / "settings.json").write_text(json.dumps(settings, indent=2) + "\n", encoding='utf-8')
+    pending.append((claude_dir / "settings.json", _json_dumps(settings)))
 
     # MCP servers
     if mcp_servers:
@@ -1949,10 +2290,16 @@ def cmd_init(
         "plugins": selected_plugins,
         "mcp_servers": mcp_servers,
         "features": selected_features,
+        "detection_cache": {
+            "fingerprint": fingerprint,
+            "langs": sorted(detected_langs),
+            "templates": sorted(detected_templates),
+            "platform": sorted(detected_platform),
+        },
     }
     if private_sources:
         manifest_data["private_sources"] = private_sources
-    save_manifest(project, manifest_data)
+    pending.append((claude_dir / "setup-manifest.json", _json_dumps(manifest_data)))
 
     # Compute deployed rules list for CLAUDE.md header
     deployed_rules = selected_base.copy()
@@ -1960,22 +2307,21 @@ def cmd_init(
         deployed_rules.extend(rules)
 
     # CLAUDE.md
-    claude_md = project / "CLAUDE.md"
     header = generate_claude_foundry_header(deployed_rules, selected_langs)
 
-    if claude_md.exists():
-        existing_content = claude_md.read_text(encoding='utf-8')
-        lines = existing_content.count("\n")
-        chars = len(existing_content)
-
-        if has_claude_foundry_header(existing_content):
+    if existing_content is not None:
+        if has_header:
             # Has marker — update header silently
             updated_content = update_claude_foundry_header(existing_content, header)
-            claude_md.write_text(updated_content, encoding='utf-8')
-            print(f"  Updated claude-foundry header in CLAUDE.md")
+            if updated_content != existing_content:
+                pending.append((claude_md, updated_content))
+                print(f"  Updated claude-foundry header in CLAUDE.md")
+            else:
+                print(f"  claude-foundry header in CLAUDE.md is up to date")
         elif interactive:
             # No marker — offer options
-            print(f"\n  CLAUDE.md exists ({lines} lines, {chars} chars)")
+            lines = existing_content.count("\n")
+            print(f"\n  CLAUDE.md exists ({lines} lines, {len(existing_content)} chars)")
             print("  Options:")
             print("    [R] Replace — Generate new CLAUDE.md (saves original as .old)")
             print("    [M] Merge — Prepend claude-foundry header (saves original as .old)")
@@ -1987,38 +2333,46 @@ def cmd_init(
             print()
             choice = input("  Choice [R/M/Q]: ").strip().upper()
             if choice == "Q":
+                _flush_writes(pending)
                 print("\n  Aborted. No changes made to CLAUDE.md.")
                 return False
             elif choice == "R":
                 # Save original and replace
                 backup = project / "CLAUDE.md.old"
-                backup.write_text(existing_content, encoding='utf-8')
-                claude_md.write_text(generate_claude_md(project_name, deployed_rules, selected_langs), encoding='utf-8')
+                pending.append((backup, existing_content))
+                pending.append((claude_md, generate_claude_md(
+                    project_name, deployed_rules, selected_langs)))
                 print(f"  Replaced CLAUDE.md (original saved to CLAUDE.md.old)")
             else:  # M or anything else defaults to Merge
                 # Save original and prepend header
                 backup = project / "CLAUDE.md.old"
-                backup.write_text(existing_content, encoding='utf-8')
+                pending.append((backup, existing_content))
                 merged = prepend_claude_foundry_header(existing_content, header)
-                claude_md.write_text(merged, encoding='utf-8')
+                pending.append((claude_md, merged))
                 print(f"  Merged claude-foundry header into CLAUDE.md (original saved to CLAUDE.md.old)")
         elif force_merge:
             # Force merge — prepend header (confirmed earlier)
             backup = project / "CLAUDE.md.old"
-            backup.write_text(existing_content, encoding='utf-8')
+            pending.append((backup, existing_content))
             merged = prepend_claude_foundry_header(existing_content, header)
-            claude_md.write_text(merged, encoding='utf-8')
+            pending.append((claude_md, merged))
             print(f"  Force-merged claude-foundry header into CLAUDE.md (original saved to CLAUDE.md.old)")
         # Note: non-interactive + no marker without force case is handled earlier (skips entire project)
     else:
-        claude_md.write_text(generate_claude_md(project_name, deployed_rules, selected_langs), encoding='utf-8')
+        pending.append((claude_md, generate_claude_md(
+            project_name, deployed_rules, selected_langs)))
         print(f"  Created CLAUDE.md")
 
+    _flush_writes(pending)
+
     # Summary
     print(f"\n✓ Project configured with claude-foundry v{version}")
     print(f"  Rules: {len(selected_base)} base + {sum(len(v) for v in selected_modular.values())} selected")
     print(f"  Hooks: {len(selected_hooks)}")
-    cmd_count = len([f for f in (COMMANDS_DIR).iterdir() if f.suffix == ".md"]) if COMMANDS_DIR.is_dir() else 0
+    cmd_count = 0
+    if COMMANDS_DIR.is_dir():
+        with os.scandir(COMMANDS_DIR) as it:
+            cmd_count = sum(1 for e in it if e.name.endswith(".md") and e.is_file())
     print(f"  Commands: {cmd_count}")
     print(f"  Agents: {len(selected_agents)}")
     print(f"  Skills: {len(selected_skills)}")
@@ -2026,6 +2380,7 @@ def cmd_init(
         print(f"  Learned: {len(selected_learned)} categories ({', '.join(selected_learned)})")
     print(f"  Plugins: {len(selected_plugins)}")
     print(f"  MCP servers: {len(mcp_servers)}")
+    print(f"  Files: {_deploy_stats['copied']} copied, {_deploy_stats['unchanged']} unchanged")
     if private_sources:
         total_private = sum(sum(len(s.get(k, [])) for k in ["rules", "commands", "skills", "agents", "hooks"]) for s in private_sources)
         prefixes = ", ".join(s["prefix"] for s in private_sources)
@@ -2248,6 +2603,23 @@ def _ensure_gitignore_entry(gitignore: Path, entry: str) -> None:
     gitignore.write_text(new_content, encoding="utf-8")
 
 
+def _init_from_manifest(path: Path, force: bool = False) -> bool | None:
+    """Non-interactive cmd_init for update-all; None if it raised."""
+    try:
+        return cmd_init(path, interactive=False, force=force)
+    except Exception as e:
+        print(f"  ✗ Failed: {e}")
+        return None
+
+
+def _update_project(path: Path) -> tuple[bool | None, str]:
+    """Process-pool worker: _init_from_manifest with its output captured."""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        success = _init_from_manifest(path)
+    return success, buf.getvalue()
+
+
 def cmd_update_all(force: bool = False) -> None:
     """Batch update all known projects.
 
@@ -2269,9 +2641,7 @@ def cmd_update_all(force: bool = False) -> None:
         manifest = load_manifest(path)
         proj_ver = ""
         if has_setup:
-            ver_file = path / ".claude" / "VERSION"
-            if ver_file.exists():
-                proj_ver = ver_file.read_text(encoding='utf-8').strip()
+            proj_ver = _read_project_version(path) or ""
         status = f"v{proj_ver}" if proj_ver else "not configured"
         has_manifest = " +manifest" if manifest else ""
         labels.append(f"{path}  ({status}{has_manifest})")
@@ -2286,120 +2656,138 @@ def cmd_update_all(force: bool = False) -> None:
     # Process each selected project
     results: dict[str, list[str]] = {"updated": [], "interactive": [], "failed": [], "skipped": []}
 
-    for idx in sorted(selected):
-        path, has_setup = projects[idx]
-        manifest = load_manifest(path)
+    def _banner(path: Path) -> None:
         print(f"\n{'=' * 60}")
         print(f"Project: {path}")
         print(f"{'=' * 60}")
 
-        if manifest:
-            # Non-interactive update using saved choices
-            print("Using saved manifest for non-interactive update...")
-            try:
-                success = cmd_init(path, interactive=False, force=force)
-                if success:
-                    results["updated"].append(str(path))
+    def _record(path: Path, success: bool | None) -> None:
+        bucket = "failed" if success is None else "updated" if success else "skipped"
+        results[bucket].append(str(path))
+
+    # Projects with a manifest update non-interactively, so they run in
+    # worker processes while the loop below walks the selection in order,
+    # printing each captured log and running interactive setups in between.
+    # Stays serial under --force (may prompt for confirmation) and when a
+    # manifest selects copilot-mcp: cmd_init then runs install-copilot-mcp.sh,
+    # which installs into the user-wide VS Code extension directory and
+    # writes to the terminal directly, so those runs must not overlap.
+    ordered = [projects[idx][0] for idx in sorted(selected)]
+    manifests = {path: load_manifest(path) for path in ordered}
+    pooled = [path for path in ordered if manifests[path]]
+    parallel = not force and len(pooled) > 1 and not any(
+        "copilot-mcp" in manifests[path].get("mcp_servers", ()) for path in pooled)
+
+    with contextlib.ExitStack() as stack:
+        pooled_results = None
+        if parallel:
+            workers = min(8, os.cpu_count() or 1, len(pooled))
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            pooled_results = pool.map(_update_project, pooled)
+
+        for path in ordered:
+            _banner(path)
+            if manifests[path]:
+                print("Using saved manifest for non-interactive update...")
+                if pooled_results is not None:
+                    success, output = next(pooled_results)
+                    print(output, end="")
                 else:
-                    results["skipped"].append(str(path))
-            except Exception as e:
-                print(f"  ✗ Failed: {e}")
-                results["failed"].append(str(path))
-        else:
+                    success = _init_from_manifest(path, force)
+                _record(path, success)
+                continue
             # Interactive init needed
             print("No manifest found — running interactive setup...")
             try:
-                success = cmd_init(path, interactive=True, force=force)
-                if success:
-                    results["interactive"].append(str(path))
-                else:
-                    results["skipped"].append(str(path))
+                bucket = "interactive" if cmd_init(path, interactive=True, force=force) else "skipped"
             except Exception as e:
                 print(f"  ✗ Failed: {e}")
-                results["failed"].append(str(path))
+                bucket = "failed"
+            results[bucket].append(str(path))
 
     # Summary
     print(f"\n{'=' * 60}")
     print("Update All — Summary")
     print(f"{'=' * 60}")
-    if results["updated"]:
-        print(f"\n  Updated (non-interactive): {len(results['updated'])}")
-        for p in results["updated"]:
-            print(f"    ✓ {p}")
-    if results["interactive"]:
-        print(f"\n  Configured (interactive): {len(results['interactive'])}")
-        for p in results["interactive"]:
-            print(f"    ✓ {p}")
-    if results["skipped"]:
-        print(f"\n  Skipped: {len(results['skipped'])}")
-        for p in results["skipped"]:
-            print(f"    — {p}")
-    if results["failed"]:
-        print(f"\n  Failed: {len(results['failed'])}")
-        for p in results["failed"]:
-            print(f"    ✗ {p}")
+    for key, title, mark in (("updated", "Updated (non-interactive)", "✓"),
+                             ("interactive", "Configured (interactive)", "✓"),
+                             ("skipped", "Skipped", "—"),
+                             ("failed", "Failed", "✗")):
+        if results[key]:
+            print(f"\n  {title}: {len(results[key])}")
+            print("\n".join(f"    {mark} {p}" for p in results[key]))
 
 
 # ── Main ────────────────────────────────────────────────────────────────
 
 
+def _main_init(args: list[str]) -> None:
+    interactive = True
+    force = False
+    # Parse flags and --private/--prefix pairs in one pass
+    private_sources: list[tuple[str, str]] = []
+    remaining: list[str] = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--non-interactive":
+            interactive = False
+            i += 1
+            continue
+        if arg == "--force":
+            force = True
+            i += 1
+            continue
+        if arg == "--private" and i + 1 < len(args):
+            src_path = args[i + 1]
+            # Check if next pair is --prefix
+            if i + 2 < len(args) and args[i + 2] == "--prefix":
+                if i + 3 < len(args):
+                    prefix = args[i + 3]
+                    i += 4
+                else:
+                    print("--prefix requires a value")
+                    sys.exit(1)
+            else:
+                # Default prefix from directory name
+                prefix = re.sub(
+                    r'[^a-z0-9-]', '-', Path(src_path).name.lower(),
+                ).strip('-') or "private"
+                i += 2
+            private_sources.append((src_path, prefix))
+        else:
+            remaining.append(arg)
+            i += 1
+    project = Path(remaining[0]) if remaining else Path.cwd()
+    cmd_init(
+        project,
+        interactive=interactive,
+        force=force,
+        cli_private_sources=private_sources or None,
+    )
+
+
+# Subcommand -> handler taking the arguments after the subcommand name
+_COMMANDS = {
+    "version": lambda args: cmd_version(),
+    "check": lambda args: cmd_check(),
+    "init": _main_init,
+    "update-all": lambda args: cmd_update_all(force="--force" in args),
+}
+
+
 def main() -> None:
     if len(sys.argv) < 2:
         print(__doc__)
         sys.exit(1)
 
     command = sys.argv[1]
-
-    if command == "version":
-        cmd_version()
-    elif command == "check":
-        cmd_check()
-    elif command == "init":
-        interactive = "--non-interactive" not in sys.argv
-        force = "--force" in sys.argv
-        # Parse --private/--prefix pairs
-        private_sources: list[tuple[str, str]] = []
-        remaining: list[str] = []
-        i = 2
-        while i < len(sys.argv):
-            arg = sys.argv[i]
-            if arg in ("--non-interactive", "--force"):
-                i += 1
-                continue
-            if arg == "--private" and i + 1 < len(sys.argv):
-                src_path = sys.argv[i + 1]
-                # Check if next pair is --prefix
-                if i + 2 < len(sys.argv) and sys.argv[i + 2] == "--prefix":
-                    if i + 3 < len(sys.argv):
-                        prefix = sys.argv[i + 3]
-                        i += 4
-                    else:
-                        print("--prefix requires a value")
-                        sys.exit(1)
-                else:
-                    # Default prefix from directory name
-                    prefix = re.sub(
-                        r'[^a-z0-9-]', '-', Path(src_path).name.lower(),
-                    ).strip('-') or "private"
-                    i += 2
-                private_sources.append((src_path, prefix))
-            else:
-                remaining.append(arg)
-                i += 1
-        project = Path(remaining[0]) if remaining else Path.cwd()
-        cmd_init(
-            project,
-            interactive=interactive,
-            force=force,
-            cli_private_sources=private_sources or None,
-        )
-    elif command == "update-all":
-        force = "--force" in sys.argv
-        cmd_update_all(force=force)
-    else:
+    handler = _COMMANDS.get(command)
+    if handler is None:
         print(f"Unknown command: {command}")
         print(__doc__)
         sys.exit(1)
+    handler(sys.argv[2:])
 
 
 if __name__ == "__main__":
@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
+_H1_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_SKIP_SKILL_DIRS = frozenset({"learned", "learned-local"})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ParsedSkill:
-    """Parsed representation of a SKILL.md file."""
+    """Parsed representation of a SKILL.md file.
+
+    ``sections`` is split out of ``body`` on first access, so callers that
+    only need the frontmatter never pay for it.
+    """
 
     name: str
     description: str
@@ -18,8 +27,14 @@ class ParsedSkill:
     extends: str | None = None
     title: str = ""
     body: str = ""
-    sections: dict[str, str] = field(default_factory=dict)
     word_count: int = 0
+    _sections: dict[str, str] | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def sections(self) -> dict[str, str]:
+        if self._sections is None:
+            object.__setattr__(self, "_sections", extract_sections(self.body))
+        return self._sections
 
 
 def parse_frontmatter(content: str) -> tuple[dict[str, str], str]:
@@ -27,19 +42,68 @@ def parse_frontmatter(content: str) -> tuple[dict[str, str], str]:
 
     Returns (frontmatter_dict, body_after_frontmatter).
     """
-    match = re.match(r"^---\s*\n(.*?)\n---\s*\n(.*)", content, re.DOTALL)
-    if not match:
+    split = _split_frontmatter(content)
+    if split is None:
         return {}, content
 
-    fm_text, body = match.group(1), match.group(2)
+    fm_text, body = split
     fm: dict[str, str] = {}
-    for line in fm_text.strip().splitlines():
-        if ":" in line:
-            key, _, value = line.partition(":")
-            fm[key.strip()] = value.strip()
+    # Index-based scan: no line list or partition tuples
+    i, end = 0, len(fm_text)
+    while i < end:
+        j = fm_text.find("\n", i)
+        if j == -1:
+            j = end
+        colon = fm_text.find(":", i, j)
+        if colon != -1:
+            fm[fm_text[i:colon].strip()] = fm_text[colon + 1:j].strip()
+        i = j + 1
     return fm, body
 
 
+def _split_frontmatter(content: str) -> tuple[str, str] | None:
+    """Split ``---`` delimited frontmatter from the body using plain string scans.
+
+    The opening and closing delimiter lines may carry trailing whitespace;
+    blank lines directly after the closing delimiter are not part of the body.
+    Returns None when there is no complete frontmatter block.
+    """
+    if not content.startswith("---"):
+        return None
+    open_end = content.find("\n", 3)
+    if open_end == -1 or content[3:open_end].strip():
+        return None
+
+    search = open_end + 1
+    while True:
+        close = content.find("\n---", search)
+        if close == -1:
+            return None
+        line_end = content.find("\n", close + 4)
+        if line_end != -1 and not content[close + 4:line_end].strip():
+            break
+        search = close + 1
+
+    # Skip whitespace-only lines after the closing delimiter
+    rest = content[line_end + 1:]
+    stripped = rest.lstrip()
+    last_nl = rest.rfind("\n", 0, len(rest) - len(stripped))
+    body = rest[last_nl + 1:]
+    return content[open_end + 1:close], body
+
+
+def _h2_heading(line: str) -> str | None:
+    """Heading text of a ``## `` line, or None; same result as ``^##\\s+(.+)$``."""
+    rest = line[2:]
+    if not rest[:1].isspace():
+        return None
+    text = rest.lstrip()
+    if text:
+        return text
+    # Whitespace-only tail: the regex leaves its last character for (.+)
+    return rest[-1] if len(rest) > 1 else None
+
+
 def extract_sections(body: str) -> dict[str, str]:
     """Extract markdown sections (## headings) from body text.
 
@@ -50,11 +114,11 @@ def extract_sections(body: str) -> dict[str, str]:
     current_lines: list[str] = []
 
     for line in body.splitlines():
-        heading_match = re.match(r"^##\s+(.+)$", line)
-        if heading_match:
+        heading = _h2_heading(line) if line.startswith("##") else None
+        if heading is not None:
             if current_heading is not None:
                 sections[current_heading] = "\n".join(current_lines).strip()
-            current_heading = heading_match.group(1)
+            current_heading = heading
             current_lines = []
         elif current_heading is not None:
             current_lines.append(line)
@@ -67,7 +131,7 @@ def extract_sections(body: str) -> dict[str, str]:
 
 def extract_title(body: str) -> str:
     """Extract the H1 title from body text."""
-    match = re.search(r"^#\s+(.+)$", body, re.MULTILINE)
+    match = _H1_RE.search(body)
     return match.group(1).strip() if match else ""
 
 
@@ -81,9 +145,16 @@ def parse_skill(path: Path) -> ParsedSkill:
         FileNotFoundError: If path does not exist.
         ValueError: If required frontmatter fields are missing.
     """
-    if not path.exists():
-        raise FileNotFoundError(f"Skill file not found: {path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Skill file not found: {path}") from None
+    return _parse_skill_cached(path, st.st_mtime_ns, st.st_size)
 
+
+@functools.lru_cache(maxsize=256)
+def _parse_skill_cached(path: Path, mtime_ns: int, size: int) -> ParsedSkill:
+    """Parse ``path``; keyed on mtime and size so an edited file is re-parsed."""
     content = path.read_text(encoding="utf-8")
     fm, body = parse_frontmatter(content)
 
@@ -92,7 +163,6 @@ def parse_skill(path: Path) -> ParsedSkill:
     if "description" not in fm:
         raise ValueError(f"Missing required frontmatter field 'description' in {path}")
 
-    sections = extract_sections(body)
     title = extract_title(body)
     word_count = len(body.split())
 
@@ -104,7 +174,6 @@ def parse_skill(path: Path) -> ParsedSkill:
         extends=fm.get("extends"),
         title=title,
         body=body,
-        sections=sections,
         word_count=word_count,
     )
 
@@ -119,13 +188,15 @@ def discover_skills(skills_dir: Path) -> list[ParsedSkill]:
     if not skills_dir.is_dir():
         return skills
 
-    for skill_dir in sorted(skills_dir.iterdir()):
-        if not skill_dir.is_dir():
-            continue
-        if skill_dir.name in ("learned", "learned-local"):
+    with os.scandir(skills_dir) as it:
+        names = sorted(
+            e.name for e in it
+            if e.name not in _SKIP_SKILL_DIRS and e.is_dir()
+        )
+    for name in names:
+        try:
+            skills.append(parse_skill(skills_dir / name / "SKILL.md"))
+        except FileNotFoundError:
             continue
-        skill_file = skill_dir / "SKILL.md"
-        if skill_file.exists():
-            skills.append(parse_skill(skill_file))
 
     return skills